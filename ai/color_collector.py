@@ -65,7 +65,8 @@ class ColorCollector:
         """Worker thread for single bookmaker"""
         sct = mss.mss()
         while True:
-            img = np.array(sct.grab(bbox))[:, :, :3]
+            shot = sct.grab(bbox)
+            img = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)[:, :, :3]
             rgb = img.mean(axis=(0, 1))[::-1]
             r, g, b = map(float, rgb)
             timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
@@ -117,7 +118,7 @@ class ColorCollector:
                     # Show last 5
                     for item in buffer[-5:]:
                         ts, bk, r, g, b = item
-                        self.logger.debug(f"{bk}: RGB({r:.0f}, {g:.0f}, {b:.0f})")
+                        self.logger.debug("%s: RGB(%.0f, %.0f, %.0f)", bk, r, g, b)
                     
                     buffer.clear()
         
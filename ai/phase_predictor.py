@@ -53,7 +53,8 @@ class PhasePredictor:
         sct = mss.mss()
         bbox = self.regions[bookmaker]
         
-        img = np.array(sct.grab(bbox))[:, :, :3]
+        shot = sct.grab(bbox)
+        img = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)[:, :, :3]
         mean_color = img.mean(axis=(0, 1))
         rgb = mean_color[::-1]  # BGR to RGB
         r, g, b = map(float, rgb)
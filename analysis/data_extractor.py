@@ -10,6 +10,10 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Union, Optional
 
 
+# Any decimal/separator character OCR may produce between score digits
+DECIMAL_SEP_RE = re.compile(r'[.,:\-/]')
+
+
 class ScoreParser:
     """Parser za score vrednosti - V3 FIXED FOR REAL"""
     
@@ -36,7 +40,7 @@ class ScoreParser:
                 next_has_suffix = next_item.endswith(('x', 'X', 'k', 'K', '%'))
                 
                 # Proveri da li current ima decimalni separator
-                current_has_decimal = any(sep in current for sep in '.,:-/')
+                current_has_decimal = DECIMAL_SEP_RE.search(current) is not None
                 
                 # SPOJI samo ako sledeći IMA suffix i trenutni NEMA decimal
                 if next_has_suffix and not current_has_decimal:
@@ -113,7 +117,7 @@ class ScoreParser:
     @staticmethod
     def _add_missing_x(text: str) -> str:
         """Dodaje 'x' broju koji nema suffix"""
-        if any(sep in text for sep in '.,:-/'):
+        if DECIMAL_SEP_RE.search(text):
             return text + 'x'
         
         digits_only = ''.join(c for c in text if c.isdigit())
@@ -179,7 +179,7 @@ class LogProcessor:
         """Proveri da li vrednost postoji i nije prazna"""
         if value is None:
             return False
-        if isinstance(value, str) and value.strip() == "":
+        if isinstance(value, str) and (not value or value.isspace()):
             return False
         if isinstance(value, float) and math.isnan(value):
             return False
@@ -8,7 +8,7 @@ import time
 import sqlite3
 from pathlib import Path
 from typing import Dict, Optional
-from multiprocessing import Process, Event, Lock
+from multiprocessing import Process, Event, Lock, Queue
 from multiprocessing.synchronize import Event as EventType, Lock as LockType
 from datetime import datetime
 
@@ -20,7 +20,7 @@ from core.gui_controller import GUIController
 from regions.score import Score
 from regions.my_money import MyMoney
 from regions.game_phase import GamePhaseDetector
-from logger import init_logging, AviatorLogger
+from logger import init_logging, start_log_server, AviatorLogger
 
 
 class BettingAgent:
@@ -42,6 +42,7 @@ class BettingAgent:
         self.coords_manager = CoordsManager()
         self.shutdown_event = Event()
         self.bet_lock = Lock()  # Transaction safety
+        self.log_queue = start_log_server()
         self.process = None
     
     def setup_database(self):
@@ -156,7 +157,8 @@ class BettingAgent:
             config=config,
             db_path=self.db_path,
             bet_lock=self.bet_lock,
-            shutdown_event=self.shutdown_event
+            shutdown_event=self.shutdown_event,
+            log_queue=self.log_queue
         )
         self.process.start()
         
@@ -201,13 +203,15 @@ class BettingProcess(Process):
         config: Dict,
         db_path: Path,
         bet_lock: LockType,
-        shutdown_event: EventType
+        shutdown_event: EventType,
+        log_queue: Optional[Queue] = None
     ):
         super().__init__(name=f"BettingAgent-{config['bookmaker']}")
         self.config = config
         self.db_path = db_path
         self.bet_lock = bet_lock
         self.shutdown_event = shutdown_event
+        self.log_queue = log_queue
     
     def setup_components(self):
         """Setup screen readers and GUI controller."""
@@ -296,6 +300,7 @@ class BettingProcess(Process):
     
     def run(self):
         """Process main loop."""
+        init_logging(log_queue=self.log_queue)
         try:
             self.setup_components()
             self.betting_loop()
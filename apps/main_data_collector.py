@@ -21,7 +21,8 @@ from regions.other_count import OtherCount
 from regions.other_money import OtherMoney
 from regions.game_phase import GamePhaseDetector
 from regions.my_money import MyMoney
-from logger import init_logging, AviatorLogger
+from regions.base_region import RegionBatch
+from logger import init_logging, start_log_server, AviatorLogger
 
 
 class MainDataCollector:
@@ -31,7 +32,7 @@ class MainDataCollector:
     """
     
     DATABASE_NAME = "main_game_data.db"
-    SCORE_THRESHOLDS = [1.5, 2.0, 3.0, 5.0, 10.0]
+    SCORE_THRESHOLDS = (1.5, 2.0, 3.0, 5.0, 10.0)  # ascending, crossed in order
     
     def __init__(self):
         init_logging()
@@ -41,6 +42,7 @@ class MainDataCollector:
         
         self.coords_manager = CoordsManager()
         self.shutdown_event = Event()
+        self.log_queue = start_log_server()
         self.processes = []
     
     def setup_database(self):
@@ -181,7 +183,8 @@ class MainDataCollector:
                 bookmaker_name=f"{bookmaker}_{position}",
                 coords=coords,
                 db_path=self.db_path,
-                shutdown_event=self.shutdown_event
+                shutdown_event=self.shutdown_event,
+                log_queue=self.log_queue
             )
             process.start()
             self.processes.append(process)
@@ -258,13 +261,15 @@ class CollectorProcess(Process):
         bookmaker_name: str,
         coords: Dict,
         db_path: Path,
-        shutdown_event: EventType
+        shutdown_event: EventType,
+        log_queue: Optional[Queue] = None
     ):
         super().__init__(name=f"Collector-{bookmaker_name}")
         self.bookmaker_name = bookmaker_name
         self.coords = coords
         self.db_path = db_path
         self.shutdown_event = shutdown_event
+        self.log_queue = log_queue
         
         # Data queues
         self.rounds_queue = []
@@ -281,6 +286,9 @@ class CollectorProcess(Process):
         self.other_count = OtherCount(self.other_count_reader)
         self.other_money = OtherMoney(self.other_money_reader)
         self.phase_detector = GamePhaseDetector(self.phase_reader)
+        
+        # Round-end reads share one screen grab
+        self.round_end_batch = RegionBatch([self.score, self.other_count, self.other_money])
     
     def collect_round_data(self):
         """Main collection loop."""
@@ -288,7 +296,10 @@ class CollectorProcess(Process):
         logger.info("Starting collection")
         
         last_phase = None
-        threshold_tracker = {t: False for t in MainDataCollector.SCORE_THRESHOLDS}
+        
+        # Thresholds are ascending and crossed in order - index of the next one
+        thresholds = MainDataCollector.SCORE_THRESHOLDS
+        next_threshold = 0
         
         while not self.shutdown_event.is_set():
             try:
@@ -298,7 +309,7 @@ class CollectorProcess(Process):
                 
                 # WAITING → FLYING transition - reset thresholds
                 if last_phase == 'WAITING' and current_phase == 'FLYING':
-                    threshold_tracker = {t: False for t in MainDataCollector.SCORE_THRESHOLDS}
+                    next_threshold = 0
                     logger.info("New round started")
                 
                 # During FLYING - track thresholds
@@ -307,32 +318,33 @@ class CollectorProcess(Process):
                     try:
                         score = float(score_text.replace('x', '').replace(',', '.').strip())
                         
-                        # Check thresholds
-                        for threshold in MainDataCollector.SCORE_THRESHOLDS:
-                            if score >= threshold and not threshold_tracker[threshold]:
-                                player_count = self.other_count.get_current_count()
-                                total_money = self.other_money.read_text()
-                                
-                                self.thresholds_queue.append({
-                                    'bookmaker': self.bookmaker_name,
-                                    'timestamp': datetime.now().isoformat(),
-                                    'threshold': threshold,
-                                    'current_players': player_count,
-                                    'current_money': total_money
-                                })
-                                threshold_tracker[threshold] = True
-                                logger.debug(f"Threshold {threshold}x reached")
+                        # Check thresholds (usually a single compare against the next one)
+                        while next_threshold < len(thresholds) and score >= thresholds[next_threshold]:
+                            threshold = thresholds[next_threshold]
+                            player_count = self.other_count.get_current_count()
+                            total_money = self.other_money.read_text()
+                            
+                            self.thresholds_queue.append({
+                                'bookmaker': self.bookmaker_name,
+                                'timestamp': datetime.now().isoformat(),
+                                'threshold': threshold,
+                                'current_players': player_count,
+                                'current_money': total_money
+                            })
+                            next_threshold += 1
+                            logger.debug("Threshold %sx reached", threshold)
                     except:
                         pass
                 
                 # FLYING → ENDED transition - save round
                 if last_phase == 'FLYING' and current_phase == 'ENDED':
-                    score_text = self.score_reader.read_once()
                     try:
+                        with self.round_end_batch.captured():
+                            score_text = self.score_reader.read_once()
+                            total_players = self.other_count.get_total_count()
+                            left_players = self.other_count.get_current_count()
+                            total_money = self.other_money.read_text()
                         final_score = float(score_text.replace('x', '').replace(',', '.').strip())
-                        total_players = self.other_count.get_total_count()
-                        left_players = self.other_count.get_current_count()
-                        total_money = self.other_money.read_text()
                         
                         self.rounds_queue.append({
                             'bookmaker': self.bookmaker_name,
@@ -364,6 +376,8 @@ class CollectorProcess(Process):
         # Final batch inserts
         self.batch_insert_rounds()
         self.batch_insert_thresholds()
+        self.round_end_batch.close()
+        self.score.close()
         logger.info("Collection stopped")
     
     def batch_insert_rounds(self):
@@ -406,6 +420,7 @@ class CollectorProcess(Process):
     
     def run(self):
         """Process main loop."""
+        init_logging(log_queue=self.log_queue)
         try:
             self.setup_readers()
             self.collect_round_data()
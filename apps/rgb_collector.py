@@ -17,7 +17,7 @@ import mss
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.coord_manager import CoordsManager
-from logger import init_logging, AviatorLogger
+from logger import init_logging, start_log_server, AviatorLogger
 
 
 class RGBCollector:
@@ -37,6 +37,7 @@ class RGBCollector:
         
         self.coords_manager = CoordsManager()
         self.shutdown_event = Event()
+        self.log_queue = start_log_server()
         self.processes = []
     
     def setup_database(self):
@@ -141,7 +142,8 @@ class RGBCollector:
                 identifier=f"{bookmaker}_{position}",
                 coords=coords,
                 db_path=self.db_path,
-                shutdown_event=self.shutdown_event
+                shutdown_event=self.shutdown_event,
+                log_queue=self.log_queue
             )
             process.start()
             self.processes.append(process)
@@ -207,13 +209,15 @@ class RGBCollectorProcess(Process):
         identifier: str,
         coords: Dict,
         db_path: Path,
-        shutdown_event: EventType
+        shutdown_event: EventType,
+        log_queue: Optional[Queue] = None
     ):
         super().__init__(name=f"RGBCollector-{identifier}")
         self.identifier = identifier
         self.coords = coords
         self.db_path = db_path
         self.shutdown_event = shutdown_event
+        self.log_queue = log_queue
         
         # Data queues
         self.phase_queue = []
@@ -232,7 +236,9 @@ class RGBCollectorProcess(Process):
         try:
             with mss.mss() as sct:
                 screenshot = sct.grab(region)
-                img = np.array(screenshot)[:, :, :3]  # Remove alpha, keep RGB
+                img = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+                    screenshot.height, screenshot.width, 4
+                )[:, :, :3]  # Remove alpha (zero-copy view)
                 
                 # Calculate statistics
                 r_avg = float(np.mean(img[:, :, 0]))
@@ -334,6 +340,7 @@ class RGBCollectorProcess(Process):
     
     def run(self):
         """Process main loop."""
+        init_logging(log_queue=self.log_queue)
         try:
             self.collect_rgb_data()
         except Exception as e:
@@ -13,11 +13,26 @@ PROJECT_ROOT = Path(__file__).parent.absolute()
 
 
 class GamePhase(IntEnum):
-    """Game phase enumeration."""
-    UNKNOWN = 0
-    WAITING = 1
-    FLYING = 2
-    CRASHED = 3
+    """
+    Game phase enumeration.
+
+    Values 0-5 are the K-means cluster IDs returned by GamePhaseDetector
+    (cluster ID == enum value). The remaining members are not produced by
+    the model and sit outside that range so they never alias a cluster.
+    """
+    # K-means clusters
+    ENDED = 0
+    LOADING = 1
+    BETTING = 2
+    SCORE_LOW = 3
+    SCORE_MID = 4
+    SCORE_HIGH = 5
+
+    # Not model outputs
+    UNKNOWN = -1
+    WAITING = 6
+    FLYING = 7
+    CRASHED = 8
 
 
 class BetState(IntEnum):
@@ -133,6 +148,9 @@ class CollectionConfig:
     rgb_interval: float = 0.5      # 500ms for RGB sampling
     betting_interval: float = 0.5  # 500ms for betting checks
     
+    # Game phase mean color: sample every Nth row/column (1 = all pixels)
+    phase_stride: int = 4
+    
     # Score thresholds for data collection
     score_thresholds: List[float] = None
     
@@ -5,7 +5,7 @@
 from core.gui_controller import GUIController
 from core.bookmaker_process import BookmakerProcess
 from database.worker import DatabaseWorker
-from logger import AviatorLogger
+from logger import AviatorLogger, start_log_server
 
 from multiprocessing import Manager
 from typing import List, Tuple, Optional, Dict
@@ -37,6 +37,9 @@ class BookmakerOrchestrator:
         self.db_queue = self.manager.Queue(maxsize=10000)  # Large buffer
         self.shutdown_event = self.manager.Event()
         
+        # Child processes log through the main process listener
+        self.log_queue = start_log_server()
+        
         self.num_bookmakers = num_bookmakers
         self.gui_controller: Optional[GUIController] = None
         self.db_worker: Optional[DatabaseWorker] = None
@@ -72,6 +75,7 @@ class BookmakerOrchestrator:
             betting_queue=self.betting_queue,
             db_queue=self.db_queue,
             shutdown_event=self.shutdown_event,
+            log_queue=self.log_queue,
             
             play_amount_coords=play_amount_coords,
             play_button_coords=play_button_coords,
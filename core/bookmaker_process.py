@@ -6,16 +6,21 @@ from regions.score import Score
 from regions.my_money import MyMoney
 from regions.other_count import OtherCount
 from regions.other_money import OtherMoney
-from regions.game_phase import GamePhaseDetector
+from regions.game_phase import GamePhaseDetector, RUNNING_PHASES
+from regions.base_region import RegionBatch
 from config import GamePhase
-from logger import AviatorLogger
+from logger import init_logging, AviatorLogger
 
 import multiprocessing as mp
 from multiprocessing import Process, Queue
 from multiprocessing.synchronize import Event as MPEvent
 import time
 import queue
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Optional
+
+
+# Phases a new BETTING phase can follow
+ROUND_START_FROM = frozenset({GamePhase.LOADING, GamePhase.ENDED})
 
 
 class BookmakerProcess(Process):
@@ -36,7 +41,8 @@ class BookmakerProcess(Process):
         my_money_region: Dict[str, int],
         other_count_region: Dict[str, int],
         other_money_region: Dict[str, int],
-        phase_region: Dict[str, int]
+        phase_region: Dict[str, int],
+        log_queue: Optional[Queue] = None
     ):
         super().__init__(name=f"{bookmaker_name}-Process")
         
@@ -48,6 +54,7 @@ class BookmakerProcess(Process):
         self.betting_queue = betting_queue
         self.db_queue = db_queue
         self.shutdown_event = shutdown_event
+        self.log_queue = log_queue
         
         self.play_amount_coords = play_amount_coords
         self.play_button_coords = play_button_coords
@@ -61,6 +68,7 @@ class BookmakerProcess(Process):
         self.score = None
         self.my_money = None
         self.phase_detector = None
+        self.region_batch = None
         self.current_bet_index = 0
         self.current_money = 0.0
         self.round_snapshots = []
@@ -75,6 +83,7 @@ class BookmakerProcess(Process):
     
     def run(self) -> None:
         """Main process loop."""
+        init_logging(log_queue=self.log_queue)
         self.logger = AviatorLogger.get_logger(f"Bookmaker-{self.bookmaker_name}")
         self.logger.info(f"Process started (PID: {mp.current_process().pid})")
         
@@ -109,7 +118,8 @@ class BookmakerProcess(Process):
         self.previous_phase = self.current_phase
         self.current_phase = self.phase_detector.get_phase()
         
-        if not self.current_phase:
+        # ENDED is cluster 0 (falsy) - test for a missing reading explicitly
+        if self.current_phase is None:
             return
         
         # STATE 1: ENDED - Round just ended
@@ -125,19 +135,20 @@ class BookmakerProcess(Process):
         
         # STATE 3: BETTING - New round starting
         elif self.current_phase == GamePhase.BETTING:
-            if self.previous_phase in [GamePhase.LOADING, GamePhase.ENDED]:
+            if self.previous_phase in ROUND_START_FROM:
                 self.logger.info("Phase: BETTING - New round started")
                 self.bet_placed_for_current_round = False  # Reset for next round
                 self.round_snapshots.clear()
         
         # STATE 4-6: SCORE phases - Collect snapshots
-        elif self.current_phase in [GamePhase.SCORE_LOW, GamePhase.SCORE_MID, GamePhase.SCORE_HIGH]:
+        elif self.current_phase in RUNNING_PHASES:
             self._collect_snapshot()
     
     def _handle_round_end(self) -> None:
         """Handle round end - collect data and send to DB."""
         try:
-            score_data = self.score.read_text()
+            with self.region_batch.captured():
+                score_data = self.score.read_text()
             
             if not score_data or 'result' not in score_data:
                 self.logger.warning("No valid round end data")
@@ -197,6 +208,8 @@ class BookmakerProcess(Process):
     def _collect_snapshot(self) -> None:
         """Collect snapshot during active round."""
         try:
+            # Live reads - only score (and phase) are used here, and most ticks
+            # skip OCR, so grabbing the union of all regions would be wasted
             score_data = self.score.read_text()
             
             if not score_data or 'current_score' not in score_data:
@@ -214,7 +227,7 @@ class BookmakerProcess(Process):
                 self.round_snapshots.append(snapshot)
                 
         except Exception as e:
-            self.logger.debug(f"Snapshot collection error: {e}")
+            self.logger.debug("Snapshot collection error: %s", e)
     
     def _initialize_regions(self) -> None:
         """Initialize region readers in child process with retry logic."""
@@ -243,6 +256,11 @@ class BookmakerProcess(Process):
             
             self.my_money = my_money
             
+            # Round end reads all five regions - one screen grab instead of five
+            self.region_batch = RegionBatch([
+                self.score, self.phase_detector, my_money, other_count, other_money
+            ])
+            
             balance_read = False
             for attempt in range(3):
                 try:
@@ -312,9 +330,12 @@ class BookmakerProcess(Process):
         
         if self.score:
             try:
+                self.score.close()
                 if hasattr(self.score, 'screen_reader'):
                     self.score.screen_reader.close()
                 if hasattr(self.score, 'phase_detector'):
                     self.score.phase_detector.close()
+                if self.region_batch:
+                    self.region_batch.close()
             except Exception as e:
                 self.logger.error(f"Cleanup error: {e}")
\ No newline at end of file
@@ -145,7 +145,7 @@ class CoordGetter:
         click_number = len(self._coords)
         
         if AppConstants.debug:
-            self.logger.debug(f"Click {click_number}: ({x}, {y})")
+            self.logger.debug("Click %s: (%s, %s)", click_number, x, y)
         
         if required_clicks == 2:
             if click_number == 1:
@@ -183,6 +183,6 @@ class CoordGetter:
         }
         
         if AppConstants.debug:
-            self.logger.debug(f"Calculated region: {region}")
+            self.logger.debug("Calculated region: %s", region)
         
         return region
\ No newline at end of file
@@ -157,7 +157,7 @@ class GUIController:
             pyautogui.click(play_button_coords)
             time.sleep(0.1)
             
-            self.logger.debug(f"Executed bet: amount={amount}, coords={play_amount_coords}, button={play_button_coords}")
+            self.logger.debug("Executed bet: amount=%s, coords=%s, button=%s", amount, play_amount_coords, play_button_coords)
             return True
             
         except pyautogui.FailSafeException:
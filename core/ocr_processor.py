@@ -12,6 +12,11 @@ from enum import Enum
 from logger import AviatorLogger
 
 
+# Player count "X/Y": drop everything but digits and '/', then match exactly one '/'
+_COUNT_CLEAN_RE = re.compile(r'[^\d/]+')
+_COUNT_RE = re.compile(r'(\d+)/(\d+)')
+
+
 # ============================================================================
 # SMART VALIDATOR (Integrated from v1.2)
 # ============================================================================
@@ -329,18 +334,14 @@ class AdvancedOCRReader:
             raw_text = pytesseract.image_to_string(img_rgb, config=config).strip()
             
             # Parse "X/Y"
-            if '/' in raw_text:
-                parts = raw_text.split('/')
-                if len(parts) == 2:
-                    try:
-                        current = int(re.sub(r'[^\d]', '', parts[0]))
-                        total = int(re.sub(r'[^\d]', '', parts[1]))
-                        
-                        # Validate range
-                        if 0 <= current <= 999999 and 0 <= total <= 999999:
-                            return (current, total)
-                    except:
-                        pass
+            match = _COUNT_RE.fullmatch(_COUNT_CLEAN_RE.sub('', raw_text))
+            if match:
+                current = int(match.group(1))
+                total = int(match.group(2))
+                
+                # Validate range
+                if 0 <= current <= 999999 and 0 <= total <= 999999:
+                    return (current, total)
             
             return None
             
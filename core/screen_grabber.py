@@ -0,0 +1,118 @@
+# core/screen_grabber.py
+# VERSION: 1.1
+# Screen capture backend: DXGI duplication (dxcam) on Windows, mss everywhere else
+# CHANGES: One shared grabber per process (get_screen_grabber), grabs serialized
+
+import atexit
+import os
+import sys
+import threading
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+try:
+    import dxcam
+    DXCAM_AVAILABLE = sys.platform == 'win32'
+except ImportError:
+    DXCAM_AVAILABLE = False
+
+
+class ScreenGrabber:
+    """
+    Captures screen regions as (H, W, 4) BGRA uint8 arrays.
+
+    On Windows with dxcam installed, regions on the primary output are
+    read from the DXGI desktop duplication surface (persistent, no per-call
+    DC/bitmap setup). Anything else - other monitors, no dxcam, Linux -
+    goes through mss with a zero-copy view of its raw buffer.
+    """
+
+    def __init__(self):
+        self._camera = None
+        self._sct = None
+
+        # dxcam returns None when the screen hasn't changed - reuse last frame
+        self._last_frames: Dict[Tuple[int, int, int, int], np.ndarray] = {}
+
+        # Capture handles are not safe to use from several threads at once
+        self._lock = threading.Lock()
+
+        if DXCAM_AVAILABLE:
+            try:
+                self._camera = dxcam.create(output_color="BGRA")
+            except Exception:
+                self._camera = None
+
+    def grab(self, bbox: Dict[str, int]) -> np.ndarray:
+        """
+        Capture region.
+
+        Args:
+            bbox: {'left', 'top', 'width', 'height'} in screen coordinates
+
+        Returns:
+            (height, width, 4) BGRA array (read-only, do not modify)
+        """
+        with self._lock:
+            frame = self._grab_dxgi(bbox) if self._camera is not None else None
+            if frame is not None:
+                return frame
+
+            if self._sct is None:
+                import mss
+                self._sct = mss.mss()
+
+            shot = self._sct.grab(bbox)
+        return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+    def _grab_dxgi(self, bbox: Dict[str, int]) -> Optional[np.ndarray]:
+        """Grab from the primary output, None if region is off-output or unavailable."""
+        left, top = bbox['left'], bbox['top']
+        right, bottom = left + bbox['width'], top + bbox['height']
+
+        if left < 0 or top < 0 or right > self._camera.width or bottom > self._camera.height:
+            return None
+
+        region = (left, top, right, bottom)
+        frame = self._camera.grab(region=region)
+
+        if frame is None:
+            return self._last_frames.get(region)
+
+        self._last_frames[region] = frame
+        return frame
+
+    def close(self) -> None:
+        """Clean up resources"""
+        with self._lock:
+            if self._camera is not None:
+                self._camera.release()
+                self._camera = None
+            if self._sct:
+                self._sct.close()
+                self._sct = None
+            self._last_frames.clear()
+
+
+_shared_grabber: Optional[ScreenGrabber] = None
+_shared_pid: Optional[int] = None
+_shared_lock = threading.Lock()
+
+
+def get_screen_grabber() -> ScreenGrabber:
+    """
+    Process-wide ScreenGrabber.
+
+    Everything that cuts sub-views out of one capture (RegionBatch,
+    GamePhaseDetector) goes through the same backend and coordinates,
+    and dxcam keeps a single duplication instance per output.
+    Closed at exit; a forked child creates its own.
+    """
+    global _shared_grabber, _shared_pid
+
+    with _shared_lock:
+        if _shared_grabber is None or _shared_pid != os.getpid():
+            _shared_grabber = ScreenGrabber()
+            _shared_pid = os.getpid()
+            atexit.register(_shared_grabber.close)
+        return _shared_grabber
@@ -1,14 +1,33 @@
 # core/screen_reader.py
-# VERSION: 1.5 - INTEGRATED FAST PREPROCESSING
-# CHANGES: Integrated AviatorPreprocessor for speed + accuracy
+# VERSION: 1.6 - OCR RESULT CACHE
+# CHANGES: OCR text cached by hash of captured pixels (unchanged region -> no Tesseract call)
 
 import cv2
+import hashlib
 import numpy as np
 import pytesseract
 import mss
+from collections import OrderedDict
 from typing import Optional, Dict, Tuple
 from logger import AviatorLogger
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+# Max cached OCR results per reader (keyed by frame hash, ocr_type, Tesseract config)
+OCR_CACHE_SIZE = 32
+
+
+def _frame_hash(img: np.ndarray):
+    """Fast content hash of a contiguous image buffer."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(img)
+    return hashlib.blake2b(img, digest_size=8).digest()
+
 
 class AviatorPreprocessor:
     """BRZI preprocessing za Aviator-specific regions"""
@@ -98,7 +117,7 @@ class ScreenReader:
     ):
         """
         Args:
-            region: {'x': int, 'y': int, 'width': int, 'height': int}
+            region: {'left', 'top', 'width', 'height'} (legacy 'x'/'y' also accepted)
             ocr_type: 'score', 'money_medium', 'money_small', 'player_count', None
             logger_name: Logger name
             use_preprocessing: Use fast preprocessing (default True)
@@ -112,9 +131,23 @@ class ScreenReader:
         self._sct = None
         self._last_image = None
         
+        # Capture target (mss monitor dict) - built once
+        self.monitor = {
+            "left": region['left'] if 'left' in region else region['x'],
+            "top": region['top'] if 'top' in region else region['y'],
+            "width": region['width'],
+            "height": region['height']
+        }
+        
+        # Pre-captured BGRA frame for the next read (set by RegionBatch)
+        self._frame = None
+        
         # Preprocessor (lazy init)
         self._preprocessor = None
         
+        # (frame hash, ocr_type, config) -> OCR text, LRU order
+        self._ocr_cache: OrderedDict = OrderedDict()
+        
         self.logger.info(
             f"Initialized: region={region}, "
             f"ocr_type={ocr_type}, "
@@ -127,29 +160,41 @@ class ScreenReader:
             self._preprocessor = AviatorPreprocessor()
         return self._preprocessor
     
+    def set_frame(self, frame: Optional[np.ndarray]) -> None:
+        """Use a pre-captured BGRA frame for the next capture_image() call."""
+        self._frame = frame
+    
+    def clear_ocr_cache(self) -> None:
+        """Drop cached OCR results (e.g. on round boundaries)."""
+        self._ocr_cache.clear()
+    
     def capture_image(self) -> np.ndarray:
         """
         Capture screenshot sa preprocessing ako je omogućeno.
         KOMPATIBILNO sa starim kodom!
         """
-        if self._sct is None:
-            self._sct = mss.mss()
-        
-        # Capture raw
-        monitor = {
-            "left": self.region['x'],
-            "top": self.region['y'],
-            "width": self.region['width'],
-            "height": self.region['height']
-        }
-        
-        screenshot = self._sct.grab(monitor)
-        img = np.array(screenshot)[:, :, :3]  # Remove alpha, keep BGR
+        return self._preprocess(self._capture_raw())
+    
+    def _capture_raw(self) -> np.ndarray:
+        """Capture BGR image (no preprocessing), kept as _last_image."""
+        if self._frame is not None:
+            # Already grabbed by RegionBatch - consume once
+            img = self._frame[:, :, :3]
+            self._frame = None
+        else:
+            if self._sct is None:
+                self._sct = mss.mss()
+            
+            # Capture raw
+            screenshot = self._sct.grab(self.monitor)
+            img = np.array(screenshot)[:, :, :3]  # Remove alpha, keep BGR
         
-        # Save za debug
+        # Save za debug (contiguous copy - also what the OCR cache hashes)
         self._last_image = img.copy()
-        
-        # Apply preprocessing AKO je omogućeno
+        return self._last_image
+    
+    def _preprocess(self, img: np.ndarray) -> np.ndarray:
+        """Apply preprocessing for ocr_type AKO je omogućeno."""
         if self.use_preprocessing and self.ocr_type:
             preprocessor = self._get_preprocessor()
             
@@ -163,27 +208,44 @@ class ScreenReader:
         
         return img
     
+    def _ocr(self, config: str) -> str:
+        """
+        Capture + OCR, skipping preprocessing and Tesseract when the
+        region's pixels are identical to a recently read frame.
+        """
+        raw = self._capture_raw()
+        key = (_frame_hash(raw), self.ocr_type, config)
+        
+        text = self._ocr_cache.get(key)
+        if text is not None:
+            self._ocr_cache.move_to_end(key)
+            return text
+        
+        img = self._preprocess(raw)
+        
+        # Ako je već preprocessed (grayscale), koristi direktno
+        if len(img.shape) == 2:
+            img_for_ocr = img
+        else:
+            # Convert BGR to RGB za pytesseract
+            img_for_ocr = img[:, :, ::-1]
+        
+        text = pytesseract.image_to_string(img_for_ocr, config=config).strip()
+        
+        self._ocr_cache[key] = text
+        if len(self._ocr_cache) > OCR_CACHE_SIZE:
+            self._ocr_cache.popitem(last=False)
+        
+        return text
+    
     def read_once(self) -> str:
         """
         Legacy metoda - KOMPATIBILNA sa starim kodom.
         Sada koristi preprocessing automatski!
         """
         try:
-            img = self.capture_image()
-            
-            # Ako je već preprocessed (grayscale), koristi direktno
-            if len(img.shape) == 2:
-                img_for_ocr = img
-            else:
-                # Convert BGR to RGB za pytesseract
-                img_for_ocr = img[:, :, ::-1]
-            
             # Basic OCR
-            text = pytesseract.image_to_string(
-                img_for_ocr, 
-                config='--oem 3 --psm 6'
-            )
-            return text.strip()
+            return self._ocr('--oem 3 --psm 6')
             
         except Exception as e:
             self.logger.error(f"OCR error: {e}")
@@ -194,16 +256,7 @@ class ScreenReader:
         Čitaj sa custom Tesseract config.
         """
         try:
-            img = self.capture_image()
-            
-            # Handle grayscale/color
-            if len(img.shape) == 2:
-                img_for_ocr = img
-            else:
-                img_for_ocr = img[:, :, ::-1]
-            
-            text = pytesseract.image_to_string(img_for_ocr, config=config)
-            return text.strip()
+            return self._ocr(config)
             
         except Exception as e:
             self.logger.error(f"OCR error: {e}")
@@ -231,6 +284,7 @@ class ScreenReader:
         if self._sct:
             self._sct.close()
             self._sct = None
+        self._ocr_cache.clear()
         self.logger.info("ScreenReader closed")
 
 
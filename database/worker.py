@@ -283,8 +283,8 @@ class DatabaseWorker(threading.Thread):
             self._update_stats(batch_size, batch_time, success=True)
             
             # Log success
-            self.logger.debug(f"✅ Batch processed: {batch_size}/{self.batch_size} items "
-                            f"in {batch_time*1000:.1f}ms")
+            self.logger.debug("✅ Batch processed: %d/%d items in %.1fms",
+                              batch_size, self.batch_size, batch_time * 1000)
             
             # Clear batch and reset timer
             self._pending_batch.clear()
@@ -61,7 +61,7 @@ class DatabaseWriter(Database):
                     self._insert_snapshots(round_id, data.get('snapshots', []))
                     self._insert_earnings(round_id, data['earnings'])
                     
-                    self.logger.debug(f"Inserted round {round_id} for {data['main']['bookmaker']}")
+                    self.logger.debug("Inserted round %s for %s", round_id, data['main']['bookmaker'])
                     return round_id
                     
         except Exception as e:
@@ -119,7 +119,7 @@ class DatabaseWriter(Database):
             VALUES (?, ?, ?, ?)
         """, snapshots)
         
-        self.logger.debug(f"Inserted {len(snapshots)} snapshots for round {round_id}")
+        self.logger.debug("Inserted %d snapshots for round %s", len(snapshots), round_id)
     
     def _insert_earnings(self, round_id: int, earnings_data: Dict[str, Any]) -> None:
         """Insert earnings data for the round."""
@@ -2,11 +2,272 @@
 # VERSION: 5.0 - Fixed for new config system
 # Centralized logging system
 
+import atexit
+import io
 import logging
+import multiprocessing
+import itertools
+import os
+import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import (
+    RotatingFileHandler, MemoryHandler, QueueHandler, QueueListener
+)
+from multiprocessing.context import BaseContext
+from typing import Optional, Tuple
+
+
+# Buffered file output: records are flushed when the buffer fills,
+# on ERROR+ records, or by the periodic flush timer (bounds latency)
+BUFFER_CAPACITY = 512
+FLUSH_INTERVAL = 1.0  # seconds
+FILE_BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE * 8
+
+# Rollover moves the full log to a staging name; the staging file is turned into .1
+# (older backups shifted) off the logging path, in order
+_STAGING_SUFFIX = ".rotating"
+_rollover_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LogRotate")
+_rollover_ids = itertools.count(1)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that formats %(asctime)s once per second.
+    
+    With a second-resolution datefmt every record within the same second
+    gets the same timestamp, so localtime() + strftime() are skipped
+    for all but the first record of each second.
+    """
+    
+    def __init__(self, fmt: str = None, datefmt: str = None):
+        super().__init__(fmt, datefmt)
+        self._cached_time = (None, None)  # (second, formatted)
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = super().formatTime(record, datefmt)
+            self._cached_time = (second, formatted)
+        return formatted
+
+
+class ColoredFormatter(CachedTimeFormatter):
+    """
+    Formatter with ANSI colored level names (console only).
+    
+    Colors are used only when the stream is a TTY. The record is
+    restored after formatting, so other handlers (file logs) never
+    see escape codes.
+    """
+    
+    COLORS = {
+        'DEBUG': '\033[36m',     # Cyan
+        'INFO': '\033[32m',      # Green
+        'WARNING': '\033[33m',   # Yellow
+        'ERROR': '\033[31m',     # Red
+        'CRITICAL': '\033[35m',  # Magenta
+        'RESET': '\033[0m'
+    }
+    
+    def __init__(self, fmt: str = None, datefmt: str = None, stream=None):
+        super().__init__(fmt, datefmt)
+        
+        # TTY check once - doesn't change during process lifetime
+        stream = stream if stream is not None else sys.stdout
+        self._use_color = bool(getattr(stream, 'isatty', lambda: False)())
+        
+        # Colored level names built once (empty when colors are off)
+        self._colored_levelname = {
+            level: f"{color}{level}{self.COLORS['RESET']}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        } if self._use_color else {}
+    
+    def format(self, record: logging.LogRecord) -> str:
+        levelname = record.levelname
+        colored = self._colored_levelname.get(levelname)
+        if colored is None:
+            return super().format(record)
+        
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+class SingleWriteRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that formats each record once and writes it
+    with a single write() into a large file buffer.
+    
+    The stdlib handler formats every record twice (size check + emit)
+    and calls tell() per record. Here the file size is tracked in memory
+    and the stream is flushed only for ERROR+ records; the rest is
+    flushed by the periodic flush timer or on close.
+    
+    Rollover renames the full file to a staging name (O(1)) and reopens
+    a fresh one; shifting .1 -> .2 ... and moving the staging file to .1
+    run on a background thread instead of under the handler lock.
+    Staging files left by a crash are shifted in on startup.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._bytes_written = 0
+        super().__init__(*args, **kwargs)
+        self._recover_staging()
+    
+    def _recover_staging(self) -> None:
+        """Queue staging files a previous run didn't finish rotating (oldest first)."""
+        log_dir = Path(self.baseFilename).parent
+        prefix = Path(self.baseFilename).name + _STAGING_SUFFIX
+        try:
+            leftovers = sorted(
+                (p for p in log_dir.iterdir() if p.name.startswith(prefix)),
+                key=lambda p: p.stat().st_mtime
+            )
+        except OSError:
+            return
+        
+        for staging in leftovers:
+            if self.backupCount > 0:
+                _rollover_executor.submit(self._shift_backups, str(staging))
+            else:
+                _rollover_executor.submit(self._remove_staging, str(staging))
+    
+    def _encoded_len(self, data: str) -> int:
+        """Size of data in the file (bytes, not characters)."""
+        if data.isascii():
+            return len(data)
+        return len(data.encode(self.encoding or 'utf-8', self.errors or 'strict'))
+    
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+        stream.seek(0, io.SEEK_END)
+        self._bytes_written = stream.tell()
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = self.format(record) + self.terminator
+            
+            if self.stream is None:
+                self.stream = self._open()
+            
+            size = self._encoded_len(data)
+            if (self.maxBytes > 0 and self._bytes_written
+                    and self._bytes_written + size >= self.maxBytes):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            
+            self.stream.write(data)
+            self._bytes_written += size
+            
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def doRollover(self) -> None:
+        if self.backupCount <= 0:
+            # No backups kept - start the file over
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.seek(0)
+            self.stream.truncate(0)
+            self._bytes_written = 0
+            return
+        
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        
+        staging = f"{self.baseFilename}{_STAGING_SUFFIX}{os.getpid()}-{next(_rollover_ids)}"
+        try:
+            # The data moves with the name - nothing is copied under the lock
+            os.replace(self.baseFilename, staging)
+        except FileNotFoundError:
+            staging = None
+        except OSError:
+            # Held open by another program (Windows) - copy aside and truncate instead
+            shutil.copyfile(self.baseFilename, staging)
+            with open(self.baseFilename, 'r+b') as f:
+                f.truncate(0)
+        
+        if staging:
+            _rollover_executor.submit(self._shift_backups, staging)
+        
+        self.stream = self._open()
+    
+    def _shift_backups(self, staging: str) -> None:
+        """Move staging file to .1, shifting older backups (runs in background)."""
+        try:
+            for i in range(self.backupCount - 1, 0, -1):
+                sfn = self.rotation_filename(f"{self.baseFilename}.{i}")
+                dfn = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+                if os.path.exists(sfn):
+                    os.replace(sfn, dfn)
+            os.replace(staging, self.rotation_filename(f"{self.baseFilename}.1"))
+        except OSError:
+            self.handleError(logging.makeLogRecord({
+                'msg': "Log rotation failed for %s", 'args': (self.baseFilename,)
+            }))
+    
+    def _remove_staging(self, staging: str) -> None:
+        """Drop a leftover staging file when no backups are kept (background)."""
+        try:
+            os.remove(staging)
+        except OSError:
+            self.handleError(logging.makeLogRecord({
+                'msg': "Could not remove %s", 'args': (staging,)
+            }))
+
+
+class LeanQueueHandler(QueueHandler):
+    """
+    QueueHandler for child processes that enqueues a small dict
+    instead of a full LogRecord.
+    
+    The message (with traceback, if any) is formatted in the child, so
+    only the fields the parent formatters need cross the process
+    boundary - no record copy, no exc_info/args to pickle.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> dict:
+        return {
+            'name': record.name,
+            'levelno': record.levelno,
+            'levelname': record.levelname,
+            'msg': self.format(record),
+            'created': record.created,
+            'msecs': record.msecs,
+            'relativeCreated': record.relativeCreated,
+        }
+
+
+class LeanQueueListener(QueueListener):
+    """QueueListener that rebuilds LogRecords sent by LeanQueueHandler."""
+    
+    def prepare(self, record):
+        if isinstance(record, dict):
+            return logging.makeLogRecord(record)
+        return record
 
 
 class AviatorLogger:
@@ -15,13 +276,32 @@ class AviatorLogger:
     
     Features:
     - Rotating file handlers (10MB per file, 5 backups)
+    - Buffered file writes, flushed every second
+    - Central log listener for child processes (single writer per file)
     - Console output with color coding
     - Separate loggers per module
     - Thread-safe
     """
     
     _initialized = False
-    _loggers = {}
+    _buffered_handlers = []
+    _flush_timer = None
+    _log_queue = None
+    _listener = None
+    
+    # Log directories already created by this process
+    _dirs_created = set()
+    
+    # File handlers created by init_logging() (main log first)
+    _file_handlers = []
+    _error_handler = None
+    
+    # Per-module file sinks from get_module_logger(), keyed by (module_name, log_file)
+    _module_file_sinks = {}
+    
+    # Process identity - resolved once per process in init_logging()
+    _pid = None
+    _process_name = None
     
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
@@ -38,21 +318,50 @@ class AviatorLogger:
         if not cls._initialized:
             init_logging()
         
-        # Return existing logger if available
-        if name in cls._loggers:
-            return cls._loggers[name]
-        
-        # Create new logger
-        logger = logging.getLogger(name)
-        cls._loggers[name] = logger
-        
-        return logger
+        return _get_logger(name)
+
+
+@lru_cache(maxsize=None)
+def _get_logger(name: str) -> logging.Logger:
+    """Cached logging.getLogger() - skips the logging module lock."""
+    return logging.getLogger(name)
+
+
+@lru_cache(maxsize=1)
+def _get_log_settings() -> Tuple[Path, str, str, int, int]:
+    """
+    Load logging settings from config (once per process).
+    
+    Returns:
+        (log_dir, log_format, date_format, max_bytes, backup_count)
+    """
+    # Import config here to avoid circular imports
+    try:
+        from config import config
+        return (
+            config.paths.logs_dir,
+            config.logging.format,
+            config.logging.date_format,
+            config.logging.max_bytes,
+            config.logging.backup_count
+        )
+    except Exception:
+        # Fallback to defaults if config not available
+        return (
+            Path("logs"),
+            "%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s",
+            "%Y-%m-%d %H:%M:%S",
+            10 * 1024 * 1024,  # 10MB
+            5
+        )
 
 
 def init_logging(
     log_level: str = "INFO",
     log_to_console: bool = True,
-    log_to_file: bool = True
+    log_to_file: bool = True,
+    log_queue: Optional[multiprocessing.Queue] = None,
+    skip_caller_info: bool = False
 ) -> None:
     """
     Initialize logging system.
@@ -61,29 +370,58 @@ def init_logging(
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_to_console: Enable console output
         log_to_file: Enable file output
+        log_queue: Queue from start_log_server() (child processes).
+                   Records go to the main process instead of log files.
+        skip_caller_info: Opt-in - skip the findCaller() frame walk when the
+                   format prints no source location. Process-wide: also
+                   affects third-party loggers (logging._srcfile = None).
     """
+    # Forked children inherit _initialized and the parent's file handlers -
+    # route them to the parent's log server instead of writing the files too
+    forked = AviatorLogger._pid is not None and AviatorLogger._pid != os.getpid()
+    if forked and log_queue is None:
+        log_queue = AviatorLogger._log_queue
     
-    if AviatorLogger._initialized:
+    if AviatorLogger._initialized and log_queue is None:
         return
     
-    # Import config here to avoid circular imports
-    try:
-        from config import config
-        log_dir = config.paths.logs_dir
-        log_format = config.logging.format
-        date_format = config.logging.date_format
-        max_bytes = config.logging.max_bytes
-        backup_count = config.logging.backup_count
-    except Exception as e:
-        # Fallback to defaults if config not available
-        log_dir = Path("logs")
-        log_format = "%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s"
-        date_format = "%Y-%m-%d %H:%M:%S"
-        max_bytes = 10 * 1024 * 1024  # 10MB
-        backup_count = 5
+    # PID / process name never change for the process lifetime
+    AviatorLogger._pid = os.getpid()
+    AviatorLogger._process_name = multiprocessing.current_process().name
+    
+    log_dir, log_format, date_format, max_bytes, backup_count = _get_log_settings()
+    
+    # Skip per-record lookups the format never prints
+    _disable_unused_record_fields(log_format, skip_caller_info)
+    
+    # Child process - forward everything to the main process listener
+    if log_queue is not None:
+        # Process identity is baked into the message once, at setup
+        queue_handler = LeanQueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter(
+            f"[{AviatorLogger._process_name}:{AviatorLogger._pid}] %(message)s"
+        ))
+        
+        root_logger = logging.getLogger()
+        root_logger.setLevel(getattr(logging, log_level.upper()))
+        root_logger.handlers.clear()
+        root_logger.addHandler(queue_handler)
+        
+        # Drop anything inherited from a forked parent (its buffered records,
+        # file handlers and listener belong to the parent)
+        for handler in AviatorLogger._buffered_handlers:
+            handler.buffer.clear()
+        AviatorLogger._buffered_handlers = []
+        AviatorLogger._file_handlers = []
+        AviatorLogger._error_handler = None
+        AviatorLogger._listener = None
+        
+        AviatorLogger._log_queue = log_queue
+        AviatorLogger._initialized = True
+        return
     
     # Create log directory
-    log_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_log_dir(log_dir)
     
     # Configure root logger
     root_logger = logging.getLogger()
@@ -93,19 +431,21 @@ def init_logging(
     root_logger.handlers.clear()
     
     # Create formatter
-    formatter = logging.Formatter(log_format, datefmt=date_format)
+    formatter = CachedTimeFormatter(log_format, datefmt=date_format)
     
     # Console handler
     if log_to_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(
+            ColoredFormatter(log_format, datefmt=date_format, stream=sys.stdout)
+        )
         root_logger.addHandler(console_handler)
     
     # File handler (main log)
     if log_to_file:
         main_log_file = log_dir / "main.log"
-        file_handler = RotatingFileHandler(
+        file_handler = SingleWriteRotatingFileHandler(
             main_log_file,
             maxBytes=max_bytes,
             backupCount=backup_count,
@@ -113,11 +453,23 @@ def init_logging(
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        
+        # Buffer main log writes instead of flushing per record
+        buffered_handler = MemoryHandler(
+            capacity=BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        buffered_handler.setLevel(logging.DEBUG)
+        root_logger.addHandler(buffered_handler)
+        AviatorLogger._buffered_handlers.append(buffered_handler)
+        AviatorLogger._file_handlers.append(file_handler)
+        _start_flush_timer()
         
         # Error log (errors only)
         error_log_file = log_dir / "error.log"
-        error_handler = RotatingFileHandler(
+        error_handler = SingleWriteRotatingFileHandler(
             error_log_file,
             maxBytes=max_bytes,
             backupCount=backup_count,
@@ -126,6 +478,8 @@ def init_logging(
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(formatter)
         root_logger.addHandler(error_handler)
+        AviatorLogger._file_handlers.append(error_handler)
+        AviatorLogger._error_handler = error_handler
     
     AviatorLogger._initialized = True
     
@@ -133,11 +487,144 @@ def init_logging(
     logger = logging.getLogger("Logger")
     logger.info("="*60)
     logger.info("Logging system initialized")
-    logger.info(f"Log directory: {log_dir}")
-    logger.info(f"Log level: {log_level}")
+    logger.info("Process: %s (PID: %d)", AviatorLogger._process_name, AviatorLogger._pid)
+    logger.info("Log directory: %s", log_dir)
+    logger.info("Log level: %s", log_level)
     logger.info("="*60)
 
 
+def _disable_unused_record_fields(log_format: str, skip_caller_info: bool = False) -> None:
+    """
+    Stop LogRecord from collecting thread/process/source info not used by format.
+    
+    Args:
+        log_format: Format string used by all handlers
+        skip_caller_info: Also drop source location (see init_logging)
+    """
+    if '%(thread' not in log_format:
+        logging.logThreads = False
+    if '%(process)' not in log_format:
+        logging.logProcesses = False
+    if '%(processName)' not in log_format:
+        logging.logMultiprocessing = False
+    
+    if not skip_caller_info:
+        return
+    
+    # No source location in format - skip findCaller() frame walk
+    source_fields = ('%(pathname)', '%(filename)', '%(module)', '%(funcName)', '%(lineno)')
+    if not any(field in log_format for field in source_fields):
+        logging._srcfile = None
+
+
+def start_log_server(ctx: Optional[BaseContext] = None) -> multiprocessing.Queue:
+    """
+    Start central log listener in the main process.
+    
+    Child processes get the returned queue and call
+    init_logging(log_queue=queue), so only the main process
+    owns the (rotating) log files.
+    
+    Args:
+        ctx: Multiprocessing context the child processes are started from.
+             Defaults to the current default context (resolved now, after
+             any set_start_method() call), which plain Process subclasses use.
+    
+    Returns:
+        Queue to pass to child processes
+    """
+    if AviatorLogger._listener is not None:
+        return AviatorLogger._log_queue
+    
+    if not AviatorLogger._initialized:
+        init_logging()
+    
+    if ctx is None:
+        ctx = multiprocessing.get_context()
+    log_queue = ctx.Queue(-1)
+    listener = LeanQueueListener(
+        log_queue,
+        *logging.getLogger().handlers,
+        respect_handler_level=True
+    )
+    listener.start()
+    
+    AviatorLogger._log_queue = log_queue
+    AviatorLogger._listener = listener
+    atexit.register(stop_log_server)
+    
+    return log_queue
+
+
+def stop_log_server() -> None:
+    """Stop central log listener (processes remaining records)."""
+    if AviatorLogger._listener is None:
+        return
+    
+    AviatorLogger._listener.stop()
+    AviatorLogger._listener = None
+
+
+def get_file_handler_path() -> Optional[Path]:
+    """
+    Get path of the main log file.
+    
+    Returns:
+        Path to main log or None if file logging is disabled
+        (or this is a child process logging through the queue)
+    """
+    if not AviatorLogger._file_handlers:
+        return None
+    return Path(AviatorLogger._file_handlers[0].baseFilename)
+
+
+def rotate_logs() -> None:
+    """Force rollover of all log files created by init_logging()."""
+    for handler in AviatorLogger._buffered_handlers:
+        handler.flush()
+    
+    for handler in AviatorLogger._file_handlers:
+        handler.acquire()
+        try:
+            handler.doRollover()
+        finally:
+            handler.release()
+
+
+def _ensure_log_dir(log_dir: Path) -> None:
+    """Create log directory once per process (skips repeated stat/mkdir)."""
+    if log_dir in AviatorLogger._dirs_created:
+        return
+    
+    log_dir.mkdir(parents=True, exist_ok=True)
+    AviatorLogger._dirs_created.add(log_dir)
+
+
+def _start_flush_timer(interval: float = FLUSH_INTERVAL) -> None:
+    """
+    Start the periodic flush of buffered handlers (single daemon timer).
+    
+    Args:
+        interval: Seconds between flushes
+    """
+    if AviatorLogger._flush_timer is not None:
+        return
+    
+    def _flush():
+        for handler in AviatorLogger._buffered_handlers:
+            handler.flush()
+            handler.target.flush()
+        
+        # Reschedule
+        AviatorLogger._flush_timer = None
+        _start_flush_timer(interval)
+    
+    timer = threading.Timer(interval, _flush)
+    timer.daemon = True
+    timer.start()
+    AviatorLogger._flush_timer = timer
+
+
 def get_module_logger(
     module_name: str,
     log_file: Optional[str] = None
@@ -160,29 +647,13 @@ def get_module_logger(
     logger = logging.getLogger(module_name)
     
     # Add separate file handler if requested
-    if log_file and not any(
-        isinstance(h, RotatingFileHandler) and log_file in str(h.baseFilename)
-        for h in logger.handlers
-    ):
-        try:
-            from config import config
-            log_dir = config.paths.logs_dir
-            max_bytes = config.logging.max_bytes
-            backup_count = config.logging.backup_count
-            log_format = config.logging.format
-            date_format = config.logging.date_format
-        except:
-            log_dir = Path("logs")
-            max_bytes = 10 * 1024 * 1024
-            backup_count = 5
-            log_format = "%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s"
-            date_format = "%Y-%m-%d %H:%M:%S"
-        
-        log_dir.mkdir(parents=True, exist_ok=True)
+    if log_file and (module_name, log_file) not in AviatorLogger._module_file_sinks:
+        log_dir, log_format, date_format, max_bytes, backup_count = _get_log_settings()
+        _ensure_log_dir(log_dir)
         
-        formatter = logging.Formatter(log_format, datefmt=date_format)
+        formatter = CachedTimeFormatter(log_format, datefmt=date_format)
         
-        file_handler = RotatingFileHandler(
+        file_handler = SingleWriteRotatingFileHandler(
             log_dir / log_file,
             maxBytes=max_bytes,
             backupCount=backup_count,
@@ -191,7 +662,18 @@ def get_module_logger(
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
         
-        logger.addHandler(file_handler)
+        buffered_handler = MemoryHandler(
+            capacity=BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        buffered_handler.setLevel(logging.DEBUG)
+        
+        logger.addHandler(buffered_handler)
+        AviatorLogger._module_file_sinks[(module_name, log_file)] = buffered_handler
+        AviatorLogger._buffered_handlers.append(buffered_handler)
+        _start_flush_timer()
     
     return logger
 
@@ -222,6 +704,16 @@ def critical(msg: str, logger_name: str = "Main", exc_info: bool = False):
     AviatorLogger.get_logger(logger_name).critical(msg, exc_info=exc_info)
 
 
+def log_exception(logger: logging.Logger, exc: BaseException, context: str = ""):
+    """
+    Log an exception with its traceback.
+    
+    The traceback is attached via exc_info and only formatted
+    when a handler actually emits the record.
+    """
+    logger.error("Exception in %s: %s", context or "unknown", exc, exc_info=exc)
+
+
 # Test function
 def test_logging():
     """Test logging functionality."""
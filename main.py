@@ -6,7 +6,9 @@ Multi-bookmaker parallel data collection with betting simulation
 """
 
 import sys
+import json
 import signal
+import threading
 import time
 import multiprocessing as mp
 from pathlib import Path
@@ -20,8 +22,43 @@ from logger import init_logging, AviatorLogger
 from core.bookmaker_orchestrator import BookmakerOrchestrator
 from core.coord_manager import CoordsManager
 from database.worker import get_worker, stop_worker
-from utils.diagnostic import run_diagnostics
-from utils.performance_analyzer import PerformanceAnalyzer
+
+STATS_INTERVAL = 30  # seconds between statistics dumps / health checks
+
+# Longest the monitoring loop waits before re-checking the shutdown flag
+WAIT_SLICE = 0.5
+
+# Set by signal_handler (plain assignment - safe in signal context);
+# the monitoring loop polls it and the main thread performs the shutdown
+_shutdown_flag = False
+
+# Every interactive setup is saved here and reused on the next launch
+LAST_SESSION_FILE = Path(__file__).parent / "data" / "last_session.json"
+
+# Banners and menus (built once)
+BAR_70 = "=" * 70
+BAR_60 = "=" * 60
+HEADER_SYSTEM = f"{BAR_70}\nAVIATOR DATA COLLECTION SYSTEM v4.0\n{BAR_70}"
+CONFIG_MENU = (
+    "\nConfiguration Options:\n"
+    "1. Use existing configuration\n"
+    "2. Create new configuration\n"
+    "3. Quick test mode (1 bookmaker)\n"
+)
+STYLE_MENU_SHORT = "1=Cautious, 2=Balanced, 3=Risky, 4=Crazy, 5=Addict, 6=All-in\n"
+
+# Interactive setup choices (index = menu number - 1)
+BET_STYLES = ('cautious', 'balanced', 'risky', 'crazy', 'addict', 'all-in')
+POSITIONS = ('Left', 'Center', 'Right', 'TopLeft', 'TopCenter', 'TopRight')
+STYLE_MENU = (
+    "\nBetting styles:\n"
+    "1. Cautious (low risk)\n"
+    "2. Balanced (moderate)\n"
+    "3. Risky (high risk)\n"
+    "4. Crazy (very high)\n"
+    "5. Addict (extreme)\n"
+    "6. All-in (maximum)\n"
+)
 
 
 class AviatorSystem:
@@ -35,6 +72,8 @@ class AviatorSystem:
         self.coords_manager = None
         self.is_running = False
         self.start_time = None
+        self._shutdown_evt = threading.Event()  # stop() from code, not signals
+        self._session: List[Dict] = []  # bookmakers added during setup
         
     def initialize(self) -> bool:
         """
@@ -48,11 +87,10 @@ class AviatorSystem:
             init_logging(debug=app_config.debug)
             self.logger = AviatorLogger.get_logger("AviatorSystem")
             
-            self.logger.info("="*70)
-            self.logger.info("AVIATOR DATA COLLECTION SYSTEM v4.0")
-            self.logger.info("="*70)
+            self.logger.info(HEADER_SYSTEM)
             
-            # Run diagnostics
+            # Run diagnostics (imported here - only the main process needs it)
+            from utils.diagnostic import run_diagnostics
             self.logger.info("Running system diagnostics...")
             if not run_diagnostics(quick=True):
                 self.logger.error("System diagnostics failed!")
@@ -79,40 +117,120 @@ class AviatorSystem:
                 print(f"CRITICAL: Initialization failed: {e}")
             return False
     
-    def configure_bookmakers(self) -> bool:
+    def configure_bookmakers(
+        self,
+        config_path: Optional[Path] = None,
+        style: Optional[str] = None,
+        interactive: bool = False
+    ) -> bool:
         """
         Configure bookmakers for data collection
         
+        Args:
+            config_path: Session JSON file - skips all prompts
+            style: Betting style override for bookmakers loaded from file
+            interactive: Force interactive setup (ignore last session)
+        
         Returns:
             True if at least one bookmaker configured
         """
         try:
-            self.logger.info("\n" + "="*70)
-            self.logger.info("BOOKMAKER CONFIGURATION")
-            self.logger.info("="*70)
+            self.logger.info("\n%s\n%s\n%s", BAR_70, "BOOKMAKER CONFIGURATION", BAR_70)
+            
+            # Non-interactive: explicit file, else last saved session
+            if config_path is None and not interactive and LAST_SESSION_FILE.exists():
+                self.logger.info("Using last session (run with --interactive to reconfigure)")
+                config_path = LAST_SESSION_FILE
+            if config_path is not None:
+                return self._load_from_file(config_path, style)
             
             # Get configuration choice
-            print("\nConfiguration Options:")
-            print("1. Use existing configuration")
-            print("2. Create new configuration")
-            print("3. Quick test mode (1 bookmaker)")
+            sys.stdout.write(CONFIG_MENU)
             
             choice = input("\nSelect option (1-3): ").strip()
             
             if choice == "3":
                 # Quick test mode
-                return self._configure_test_mode()
+                configured = self._configure_test_mode()
             elif choice == "2":
                 # New configuration
-                return self._configure_new_bookmakers()
+                configured = self._configure_new_bookmakers()
             else:
                 # Existing configuration
-                return self._load_existing_configuration()
+                configured = self._load_existing_configuration()
+            
+            if configured:
+                self._save_session()
+            return configured
                 
         except Exception as e:
             self.logger.error(f"Configuration failed: {e}", exc_info=True)
             return False
     
+    def _load_from_file(self, path: Path, style: Optional[str] = None) -> bool:
+        """
+        Add bookmakers from a session JSON file (no prompts)
+        
+        File is a list of objects with keys:
+        name, position, bet_style, collection_interval, coords
+        """
+        entries = json.loads(Path(path).read_text(encoding='utf-8'))
+        
+        for entry in entries:
+            bet_style = style or entry.get('bet_style', 'balanced')
+            if bet_style not in BET_STYLES:
+                self.logger.warning(
+                    "Unknown bet style %r for %s - using balanced", bet_style, entry['name']
+                )
+                bet_style = 'balanced'
+            
+            self._add_bookmaker(
+                name=entry['name'],
+                position=entry.get('position', ''),
+                coords=entry['coords'],
+                bet_style=bet_style,
+                collection_interval=entry.get(
+                    'collection_interval', app_config.default_collection_interval
+                )
+            )
+        
+        self.logger.info(f"Loaded {len(entries)} bookmakers from {path}")
+        return len(entries) > 0
+    
+    def _add_bookmaker(
+        self,
+        name: str,
+        position: str,
+        coords: Dict,
+        bet_style: str,
+        collection_interval: float
+    ) -> None:
+        """Add bookmaker to orchestrator and record it for the session file"""
+        self.orchestrator.add_bookmaker(
+            name=name,
+            coords=coords,
+            bet_style=bet_style,
+            collection_interval=collection_interval
+        )
+        self._session.append({
+            'name': name,
+            'position': position,
+            'bet_style': bet_style,
+            'collection_interval': collection_interval,
+            'coords': coords
+        })
+    
+    def _save_session(self) -> None:
+        """Save configured bookmakers so the next launch can skip setup"""
+        try:
+            LAST_SESSION_FILE.parent.mkdir(parents=True, exist_ok=True)
+            LAST_SESSION_FILE.write_text(
+                json.dumps(self._session, indent=2), encoding='utf-8'
+            )
+            self.logger.info(f"Session saved to {LAST_SESSION_FILE}")
+        except (OSError, TypeError) as e:
+            self.logger.warning(f"Could not save session: {e}")
+    
     def _configure_test_mode(self) -> bool:
         """Configure single bookmaker for testing"""
         self.logger.info("Configuring test mode with 1 bookmaker...")
@@ -126,8 +244,10 @@ class AviatorSystem:
         }
         
         # Setup coordinates
-        print("\n📍 Setting up test bookmaker coordinates...")
-        print("Please position the game window and follow instructions...")
+        sys.stdout.write(
+            "\n📍 Setting up test bookmaker coordinates...\n"
+            "Please position the game window and follow instructions...\n"
+        )
         
         coords = self.coords_manager.setup_bookmaker_interactive(
             test_config['name'],
@@ -140,8 +260,9 @@ class AviatorSystem:
             self.coords_manager.save_coordinates(config_name, 'Center', coords)
             
             # Add to orchestrator
-            self.orchestrator.add_bookmaker(
+            self._add_bookmaker(
                 name=test_config['name'],
+                position=test_config['position'],
                 coords=coords,
                 bet_style=test_config['bet_style'],
                 collection_interval=test_config['collection_interval']
@@ -154,6 +275,9 @@ class AviatorSystem:
     
     def _configure_new_bookmakers(self) -> bool:
         """Configure multiple bookmakers interactively"""
+        info = self.logger.info
+        warn = self.logger.warning
+        
         config_name = input("\nEnter configuration name: ").strip()
         if not config_name:
             config_name = f"config_{int(time.time())}"
@@ -164,29 +288,20 @@ class AviatorSystem:
         configured = 0
         
         for i in range(num_bookmakers):
-            print(f"\n{'='*60}")
-            print(f"BOOKMAKER {i+1}/{num_bookmakers}")
-            print(f"{'='*60}")
+            sys.stdout.write(f"\n{BAR_60}\nBOOKMAKER {i+1}/{num_bookmakers}\n{BAR_60}\n")
             
             # Get bookmaker details
             name = input(f"Bookmaker name: ").strip()
             if not name:
                 name = f"Bookmaker_{i+1}"
             
-            position = ['Left', 'Center', 'Right', 'TopLeft', 'TopCenter', 'TopRight'][i]
+            position = POSITIONS[i]
             
             # Choose betting style
-            print("\nBetting styles:")
-            print("1. Cautious (low risk)")
-            print("2. Balanced (moderate)")
-            print("3. Risky (high risk)")
-            print("4. Crazy (very high)")
-            print("5. Addict (extreme)")
-            print("6. All-in (maximum)")
+            sys.stdout.write(STYLE_MENU)
             
             style_choice = int(input("Select style (1-6): ").strip() or "2")
-            styles = ['cautious', 'balanced', 'risky', 'crazy', 'addict', 'all-in']
-            bet_style = styles[style_choice - 1] if 1 <= style_choice <= 6 else 'balanced'
+            bet_style = BET_STYLES[style_choice - 1] if 1 <= style_choice <= 6 else 'balanced'
             
             # Setup coordinates
             print(f"\n📍 Setting up coordinates for {name}...")
@@ -197,33 +312,38 @@ class AviatorSystem:
                 self.coords_manager.save_coordinates(config_name, position, coords)
                 
                 # Add to orchestrator
-                self.orchestrator.add_bookmaker(
+                self._add_bookmaker(
                     name=name,
+                    position=position,
                     coords=coords,
                     bet_style=bet_style,
                     collection_interval=app_config.default_collection_interval
                 )
                 
                 configured += 1
-                self.logger.info(f"Configured {name} ({position}) with {bet_style} strategy")
+                info(f"Configured {name} ({position}) with {bet_style} strategy")
             else:
-                self.logger.warning(f"Failed to configure {name}")
+                warn(f"Failed to configure {name}")
         
-        self.logger.info(f"Configured {configured}/{num_bookmakers} bookmakers")
+        info(f"Configured {configured}/{num_bookmakers} bookmakers")
         return configured > 0
     
     def _load_existing_configuration(self) -> bool:
         """Load existing bookmaker configuration"""
+        info = self.logger.info
+        warn = self.logger.warning
+        err = self.logger.error
+        
         # List available configurations
         configs = self.coords_manager.list_configurations()
         
         if not configs:
-            self.logger.warning("No existing configurations found")
+            warn("No existing configurations found")
             return False
         
-        print("\nAvailable configurations:")
-        for i, config in enumerate(configs, 1):
-            print(f"{i}. {config}")
+        sys.stdout.write("\nAvailable configurations:\n" + "".join(
+            f"{i}. {config}\n" for i, config in enumerate(configs, 1)
+        ))
         
         choice = input("\nSelect configuration: ").strip()
         
@@ -237,83 +357,90 @@ class AviatorSystem:
             bookmakers = self.coords_manager.load_configuration(config_name)
             
             if not bookmakers:
-                self.logger.error(f"Configuration '{config_name}' is empty")
+                err(f"Configuration '{config_name}' is empty")
                 return False
             
             # Add bookmakers to orchestrator
             for position, data in bookmakers.items():
                 # Get betting style
-                print(f"\nSelect betting style for {data.get('name', position)}:")
-                print("1=Cautious, 2=Balanced, 3=Risky, 4=Crazy, 5=Addict, 6=All-in")
+                sys.stdout.write(
+                    f"\nSelect betting style for {data.get('name', position)}:\n{STYLE_MENU_SHORT}"
+                )
                 style_choice = int(input("Choice (1-6): ").strip() or "2")
+                bet_style = BET_STYLES[style_choice - 1] if 1 <= style_choice <= 6 else 'balanced'
                 
-                styles = ['cautious', 'balanced', 'risky', 'crazy', 'addict', 'all-in']
-                bet_style = styles[style_choice - 1] if 1 <= style_choice <= 6 else 'balanced'
-                
-                self.orchestrator.add_bookmaker(
+                self._add_bookmaker(
                     name=data.get('name', position),
+                    position=position,
                     coords=data,
                     bet_style=bet_style,
                     collection_interval=app_config.default_collection_interval
                 )
             
-            self.logger.info(f"Loaded {len(bookmakers)} bookmakers from '{config_name}'")
+            info(f"Loaded {len(bookmakers)} bookmakers from '{config_name}'")
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to load configuration: {e}")
+            err(f"Failed to load configuration: {e}")
             return False
     
     def start(self) -> None:
         """Start the data collection system"""
+        info = self.logger.info
+        
         try:
-            self.logger.info("\n" + "="*70)
-            self.logger.info("STARTING DATA COLLECTION")
-            self.logger.info("="*70)
+            info("\n%s\n%s\n%s", BAR_70, "STARTING DATA COLLECTION", BAR_70)
             
             self.is_running = True
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
             
             # Start orchestrator
             self.orchestrator.start()
             
-            self.logger.info(f"System running with {self.orchestrator.worker_count} bookmakers")
-            self.logger.info("Press Ctrl+C to stop...")
+            info(f"System running with {self.orchestrator.worker_count} bookmakers")
+            info("Press Ctrl+C to stop...")
             
             # Main monitoring loop
             self._run_monitoring_loop()
             
         except KeyboardInterrupt:
-            self.logger.info("\nReceived shutdown signal...")
+            info("\nReceived shutdown signal...")
         except Exception as e:
             self.logger.critical(f"System error: {e}", exc_info=True)
         finally:
             self.stop()
     
     def _run_monitoring_loop(self) -> None:
-        """Main monitoring loop"""
-        last_stats_time = time.time()
+        """Main monitoring loop - sleeps until next stats dump or shutdown"""
+        info = self.logger.info
+        warn = self.logger.warning
         
-        while self.is_running:
-            try:
-                # Sleep briefly
-                time.sleep(1)
+        next_stats = time.monotonic() + STATS_INTERVAL
+        
+        try:
+            while not _shutdown_flag:
+                timeout = min(max(0, next_stats - time.monotonic()), WAIT_SLICE)
+                if self._shutdown_evt.wait(timeout=timeout) or _shutdown_flag:
+                    break
+                if time.monotonic() < next_stats:
+                    continue
                 
                 # Log statistics periodically
-                if time.time() - last_stats_time >= 30:
-                    self._log_system_stats()
-                    last_stats_time = time.time()
+                self._log_system_stats()
                 
                 # Check system health
                 if not self.orchestrator.is_healthy():
-                    self.logger.warning("System health check failed")
+                    warn("System health check failed")
                 
-            except KeyboardInterrupt:
-                break
+                next_stats = time.monotonic() + STATS_INTERVAL
+            
+            info("Received shutdown signal...")
+        except KeyboardInterrupt:
+            pass
     
     def _log_system_stats(self) -> None:
-        """Log system statistics"""
-        runtime = time.time() - self.start_time
+        """Log system statistics (single multi-line record)"""
+        runtime = time.monotonic() - self.start_time
         
         # Get database stats
         db_stats = self.db_worker.get_stats()
@@ -321,73 +448,117 @@ class AviatorSystem:
         # Get orchestrator stats
         orch_stats = self.orchestrator.get_stats()
         
-        self.logger.info("="*60)
-        self.logger.info("SYSTEM STATISTICS")
-        self.logger.info("="*60)
-        self.logger.info(f"Runtime:        {runtime/60:.1f} minutes")
-        self.logger.info(f"Bookmakers:     {orch_stats['active_workers']}/{orch_stats['total_workers']}")
-        self.logger.info(f"DB Processed:   {db_stats['total_processed']:,}")
-        self.logger.info(f"DB Queue:       {db_stats['queue_size']:,}")
-        self.logger.info(f"Throughput:     {db_stats['items_per_second']:.1f} items/sec")
-        self.logger.info("="*60)
+        bar = BAR_60
+        self.logger.info("\n".join([
+            bar,
+            "SYSTEM STATISTICS",
+            bar,
+            f"Runtime:        {runtime/60:.1f} minutes",
+            f"Bookmakers:     {orch_stats['active_workers']}/{orch_stats['total_workers']}",
+            f"DB Processed:   {db_stats['total_processed']:,}",
+            f"DB Queue:       {db_stats['queue_size']:,}",
+            f"Throughput:     {db_stats['items_per_second']:.1f} items/sec",
+            bar
+        ]))
     
     def stop(self) -> None:
         """Stop the system gracefully"""
-        self.logger.info("\n" + "="*70)
-        self.logger.info("SHUTTING DOWN SYSTEM")
-        self.logger.info("="*70)
+        info = self.logger.info
+        
+        info("\n%s\n%s\n%s", BAR_70, "SHUTTING DOWN SYSTEM", BAR_70)
         
         self.is_running = False
+        self._shutdown_evt.set()
         
         # Stop orchestrator
         if self.orchestrator:
-            self.logger.info("Stopping bookmaker orchestrator...")
+            info("Stopping bookmaker orchestrator...")
             self.orchestrator.stop()
         
         # Stop database worker
-        self.logger.info("Stopping database worker...")
+        info("Stopping database worker...")
         stop_worker()
         
         # Log final statistics
         if self.start_time:
-            runtime = time.time() - self.start_time
-            self.logger.info(f"Total runtime: {runtime/60:.1f} minutes")
+            runtime = time.monotonic() - self.start_time
+            info(f"Total runtime: {runtime/60:.1f} minutes")
         
-        # Run performance analysis
-        self.logger.info("Running final performance analysis...")
+        # Run performance analysis (imported here - only needed at shutdown)
+        from utils.performance_analyzer import PerformanceAnalyzer
+        info("Running final performance analysis...")
         analyzer = PerformanceAnalyzer()
         analyzer.analyze_session()
         
-        self.logger.info("System shutdown complete")
-        self.logger.info("="*70)
+        info("System shutdown complete")
+        info(BAR_70)
 
 
 def signal_handler(sig, frame):
-    """Handle interrupt signals"""
-    print("\n[SIGNAL] Shutdown requested...")
-    sys.exit(0)
+    """
+    Handle interrupt signals
+    
+    Only flags the shutdown - no locks, logging or I/O in signal context.
+    The monitoring loop sees it within WAIT_SLICE and stop() runs on the main thread.
+    """
+    global _shutdown_flag
+    _shutdown_flag = True
 
 
 def main():
     """Main entry point"""
-    # Set up signal handling
-    signal.signal(signal.SIGINT, signal_handler)
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Aviator Data Collection System')
+    parser.add_argument('--config', type=Path,
+                       help='Session JSON file with bookmakers (skips setup prompts)')
+    parser.add_argument('--style', choices=BET_STYLES,
+                       help='Betting style for all bookmakers loaded from file')
+    parser.add_argument('--interactive', action='store_true',
+                       help='Configure bookmakers interactively (ignore last session)')
+    
+    args = parser.parse_args()
     
     # Set multiprocessing start method
-    mp.set_start_method('spawn', force=True)
+    # forkserver on POSIX: shared modules are imported once in the server,
+    # workers are forked from it instead of re-importing everything
+    if sys.platform != 'win32':
+        mp.set_start_method('forkserver', force=True)
+        mp.set_forkserver_preload([
+            'config',
+            'logger',
+            'core.bookmaker_orchestrator',
+            'database.worker'
+        ])
+    else:
+        mp.set_start_method('spawn', force=True)
     
     # Create and run system
     system = AviatorSystem()
     
-    # Initialize
-    if not system.initialize():
-        print("Failed to initialize system!")
-        sys.exit(1)
+    try:
+        # Initialize
+        if not system.initialize():
+            print("Failed to initialize system!")
+            sys.exit(1)
+        
+        # Configure bookmakers
+        if not system.configure_bookmakers(
+            config_path=args.config,
+            style=args.style,
+            interactive=args.interactive
+        ):
+            print("No bookmakers configured!")
+            sys.exit(1)
+    except KeyboardInterrupt:
+        print("\n[SIGNAL] Shutdown requested...")
+        sys.exit(0)
     
-    # Configure bookmakers
-    if not system.configure_bookmakers():
-        print("No bookmakers configured!")
-        sys.exit(1)
+    # Set up signal handling (Ctrl+C during setup still aborts via KeyboardInterrupt)
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+    if hasattr(signal, 'SIGBREAK'):  # Ctrl+Break on Windows
+        signal.signal(signal.SIGBREAK, signal_handler)
     
     # Start system
     system.start()
@@ -2,14 +2,13 @@
 # VERSION: 1.0
 # Quick start helper for new users
 
+import os
 import sys
 import subprocess
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import config, BOOKMAKERS_INFO
-
 
 def print_header(text: str):
     """Print formatted header."""
@@ -26,12 +25,22 @@ def print_menu(title: str, options: list):
         print(f"{i}. {option}")
 
 
-def run_command(command: list, description: str):
-    """Run subprocess command with description."""
+def run_command(command: list, description: str, replace: bool = False):
+    """
+    Run subprocess command with description.
+    
+    replace=True replaces quick_start with the command (no extra
+    interpreter, never returns). Used for programs that end the
+    session. Windows has no real exec, so it falls back to subprocess.
+    """
     print(f"\n🚀 {description}...")
     print(f"   Command: {' '.join(command)}")
     print()
     
+    if replace and sys.platform != 'win32':
+        sys.stdout.flush()
+        os.execvp(command[0], command)
+    
     try:
         subprocess.run(command, check=True)
         print(f"\n✅ {description} completed")
@@ -145,6 +154,8 @@ def test_region_visualization():
 
 def css_injection_guide():
     """Show CSS injection guide."""
+    from config import config, BOOKMAKERS_INFO
+    
     print_header("CSS INJECTION GUIDE")
     
     print("\n⚠️  IMPORTANT: Before running any programs, inject CSS!")
@@ -228,7 +239,7 @@ def run_program():
             
             confirm = input("\nAll checks passed? (yes/no): ").strip().lower()
             if confirm in ['yes', 'y']:
-                run_command([sys.executable, path], name)
+                run_command([sys.executable, path], name, replace=True)
         
     except ValueError:
         print("Invalid choice")
@@ -1,10 +1,33 @@
 # region.py
 
 from core.screen_reader import ScreenReader
+from core.screen_grabber import get_screen_grabber
+from logger import AviatorLogger
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, List, Optional
 import re
 
+import numpy as np
+
+
+# Everything except digits and dot (also covers spaces, 'x' and commas)
+_NON_NUMERIC_RE = re.compile(r'[^0-9.]+')
+
+
+@lru_cache(maxsize=256)
+def _parse_number(text: str) -> float:
+    """Strip non-numeric characters and convert; memoized (OCR text repeats across polls)."""
+    cleaned_text = _NON_NUMERIC_RE.sub('', text)
+    
+    if not cleaned_text:
+        raise ValueError("Text is empty after cleaning")
+    
+    return float(cleaned_text)
+
 
 class Region(ABC):  # ABC = Abstract Base Class
     '''
@@ -26,6 +49,14 @@ class Region(ABC):  # ABC = Abstract Base Class
         """Svaka klasa koja nasleđuje mora da implementira ovaj metod"""
         pass
     
+    def capture_bbox(self) -> Dict[str, int]:
+        """Screen area this region reads (mss monitor dict)."""
+        return self.screen_reader.monitor
+    
+    def set_frame(self, frame: Optional[np.ndarray]) -> None:
+        """Hand a pre-captured BGRA frame to the next read."""
+        self.screen_reader.set_frame(frame)
+    
     def _extract_number_from_text(self, text: str) -> float:
         """
         Extract current score from running game text.
@@ -35,16 +66,99 @@ class Region(ABC):  # ABC = Abstract Base Class
         Raises ValueError if extraction fails.
         """
         try:
-            # Remove spaces, 'x', and commas
-            cleaned_text = text.replace(' ', '').replace('x', '').replace(',', '')
+            # Remove spaces, 'x', commas and any other non-numeric characters except dot
+            return _parse_number(text)
+        
+        except ValueError as e:
+            raise ValueError(f"Failed to extract current score from text: {e}")
+
+
+class OcrRegion(Region):
+    """
+    Region read with ScreenReader's advanced OCR.
+    
+    Subclasses only declare OCR_TYPE (preprocessing/parser profile)
+    and LABEL (for log messages) - reading logic lives here once.
+    """
+    
+    OCR_TYPE: str = None
+    LABEL: str = None
+    
+    def __init__(self, screen_reader: ScreenReader):
+        super().__init__(screen_reader)
+        self.logger = AviatorLogger.get_logger(type(self).__name__)
+        self.screen_reader.ocr_type = self.OCR_TYPE
+    
+    def read_text(self):
+        """Read region value using advanced OCR (None on failure)."""
+        try:
+            value = self.screen_reader.read_with_advanced_ocr(self.OCR_TYPE)
             
-            # Remove any remaining non-numeric characters except dot
-            cleaned_text = re.sub(r'[^0-9.]', '', cleaned_text)
+            if value is not None:
+                self.logger.debug("%s: %.2f", self.LABEL, value)
             
-            if not cleaned_text:
-                raise ValueError("Text is empty after cleaning")
+            return value
             
-            return float(cleaned_text)
+        except Exception as e:
+            self.logger.error("Error reading %s: %s", self.LABEL.lower(), e)
+            return None
+
+
+class RegionBatch:
+    """
+    Captures several regions with a single grab of their union.
+    
+    Each region gets a zero-copy sub-view of the shared frame for its
+    next read, so N regions cost one screen capture instead of N.
+    OCR reads can then run in parallel (tesseract releases the GIL).
+    """
+    
+    def __init__(self, regions: List[Region], max_workers: Optional[int] = None):
+        self.regions = regions
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or len(regions),
+            thread_name_prefix="RegionRead"
+        )
+    
+    def capture_all(self) -> None:
+        """Grab the union of all regions once and distribute sub-views."""
+        boxes = [region.capture_bbox() for region in self.regions]
+        left = min(b['left'] for b in boxes)
+        top = min(b['top'] for b in boxes)
+        union = {
+            'left': left,
+            'top': top,
+            'width': max(b['left'] + b['width'] for b in boxes) - left,
+            'height': max(b['top'] + b['height'] for b in boxes) - top
+        }
         
-        except ValueError as e:
-            raise ValueError(f"Failed to extract current score from text: {e}")
+        # Same backend as GamePhaseDetector's live captures - sub-views line up
+        frame = get_screen_grabber().grab(union)
+        
+        for region, b in zip(self.regions, boxes):
+            y = b['top'] - top
+            x = b['left'] - left
+            region.set_frame(frame[y:y + b['height'], x:x + b['width']])
+    
+    def clear_frames(self) -> None:
+        """Drop unconsumed frames so later reads capture live again."""
+        for region in self.regions:
+            region.set_frame(None)
+    
+    @contextmanager
+    def captured(self):
+        """Reads inside the block use one shared capture."""
+        self.capture_all()
+        try:
+            yield self
+        finally:
+            self.clear_frames()
+    
+    def read_all(self) -> List:
+        """Capture once, then read all regions in parallel (results in order)."""
+        with self.captured():
+            return list(self._executor.map(lambda region: region.read_text(), self.regions))
+    
+    def close(self) -> None:
+        """Clean up resources"""
+        self._executor.shutdown(wait=False)
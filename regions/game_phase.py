@@ -3,15 +3,67 @@
 # CHANGES: Fixed cluster ID mapping (removed +1), improved error handling
 
 from core.screen_reader import ScreenReader
+from core.screen_grabber import get_screen_grabber
 from regions.base_region import Region
 from logger import AviatorLogger
-from config import AppConstants, GamePhase
+from config import AppConstants, GamePhase, config
 
-import pickle
+import time
 import numpy as np
-import mss
+from pathlib import Path
 from typing import Optional, Dict
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Debug flag captured once - checked on every frame
+_DEBUG = AppConstants.debug
+
+# GamePhase values a cluster ID may map to (ENDED..SCORE_HIGH = clusters 0-5)
+_VALID_PHASES = frozenset(range(GamePhase.ENDED, GamePhase.SCORE_HIGH + 1))
+
+# Phases while the multiplier is climbing
+RUNNING_PHASES = frozenset({GamePhase.SCORE_LOW, GamePhase.SCORE_MID, GamePhase.SCORE_HIGH})
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _mean_and_predict(buf, width, height, stride, centers):
+        """
+        Single pass over a raw BGRA buffer: per-channel sums (every
+        stride-th row/column), mean RGB, then nearest centroid.
+        Returns (cluster, r, g, b).
+        """
+        n_pixels = 0
+        sum_b = 0
+        sum_g = 0
+        sum_r = 0
+        for y in range(0, height, stride):
+            row = y * width * 4
+            for x in range(0, width, stride):
+                o = row + x * 4
+                sum_b += buf[o]
+                sum_g += buf[o + 1]
+                sum_r += buf[o + 2]
+                n_pixels += 1
+        
+        r = sum_r / n_pixels
+        g = sum_g / n_pixels
+        b = sum_b / n_pixels
+        
+        best = 0
+        best_dist = np.inf
+        for k in range(centers.shape[0]):
+            dist = (centers[k, 0] - r) ** 2 + (centers[k, 1] - g) ** 2 + (centers[k, 2] - b) ** 2
+            if dist < best_dist:
+                best_dist = dist
+                best = k
+        return best, r, g, b
+
 
 class GamePhaseDetector(Region):
     """
@@ -21,6 +73,9 @@ class GamePhaseDetector(Region):
     K-Means Model returns clusters 0-5 which directly map to GamePhase enum values.
     """
     
+    # get_phase() / is_*() calls within this window share one reading
+    PHASE_TTL = 0.01  # seconds
+    
     def __init__(
         self,
         screen_reader: ScreenReader,
@@ -29,21 +84,74 @@ class GamePhaseDetector(Region):
         super().__init__(screen_reader)
         self.logger = AviatorLogger.get_logger("GamePhaseDetector")
         self.model_path = model_path
-        self.kmeans = self._load_model()
-        self._sct = None
+        
+        # Only the centroids are needed - prediction is a plain nearest-center lookup
+        self._centers = self._load_model()
+        
+        # float32 copy + squared norms for BLAS batch prediction
+        self._centers32 = self._centers.astype(np.float32)
+        self._center_norms = (self._centers32 ** 2).sum(axis=1)
+        
+        # Every cluster ID maps to a phase -> per-frame validation is unnecessary
+        self._all_clusters_valid = set(range(len(self._centers))) <= _VALID_PHASES
+        if not self._all_clusters_valid:
+            self.logger.warning(
+                "Model has %d clusters but GamePhase defines %d values - validating each prediction",
+                len(self._centers), len(_VALID_PHASES)
+            )
+        
+        if NUMBA_AVAILABLE:
+            # Compile (or load cached) kernel now, not on the first frame
+            _mean_and_predict(np.zeros(4, dtype=np.uint8), 1, 1, 1, self._centers)
+        
+        # Capture target and grabber built once, not per frame
+        self.set_region(screen_reader.region)
+        self._grabber = get_screen_grabber()
+        self._frame = None
+        
+        # Last phase reading (see refresh())
+        self._phase_cache = None
+        self._phase_ts = float('-inf')
     
-    def _load_model(self):
-        """Load K-means model from pickle file"""
+    def _load_model(self) -> np.ndarray:
+        """
+        Load K-means centroids.
+        
+        Reads the .npy centroid file next to the model. If it doesn't exist
+        yet, or the pickled sklearn model is newer (retrained), the model is
+        loaded once and its centroids are (re-)exported, so later starts skip
+        pickle/sklearn entirely.
+        """
+        model_path = Path(self.model_path)
+        centers_path = model_path.with_suffix('.npy')
+        
         try:
-            with open(self.model_path, "rb") as f:
-                kmeans = pickle.load(f)
-            self.logger.info(f"Loaded K-means model from {self.model_path}")
-            return kmeans
+            stale = (
+                centers_path.exists() and model_path.exists()
+                and model_path.stat().st_mtime > centers_path.stat().st_mtime
+            )
+            if centers_path.exists() and not stale:
+                centers = np.load(centers_path)
+                self.logger.info("Loaded K-means centroids from %s", centers_path)
+            else:
+                import pickle
+                with open(model_path, "rb") as f:
+                    kmeans = pickle.load(f)
+                centers = np.asarray(kmeans.cluster_centers_, dtype=np.float64)
+                self.logger.info("Loaded K-means model from %s", model_path)
+                
+                try:
+                    np.save(centers_path, centers)
+                    self.logger.info("Exported centroids to %s", centers_path)
+                except OSError as e:
+                    self.logger.warning("Could not export centroids: %s", e)
+            
+            return np.ascontiguousarray(centers, dtype=np.float64)
         except FileNotFoundError:
-            self.logger.error(f"Model file not found: {self.model_path}")
+            self.logger.error("Model file not found: %s", self.model_path)
             raise
         except Exception as e:
-            self.logger.error(f"Error loading model: {e}")
+            self.logger.error("Error loading model: %s", e)
             raise
     
     def read_text(self) -> Optional[Dict]:
@@ -54,99 +162,153 @@ class GamePhaseDetector(Region):
             Dict with 'phase' (GamePhase enum) or None if error
         """
         try:
-            rgb = self._get_mean_rgb()
-            if rgb is None:
+            buf = self._capture_raw()
+            if buf is None:
                 return None
             
-            phase = self._predict_phase(rgb)
+            if NUMBA_AVAILABLE:
+                # Fused kernel: one pass, no intermediate arrays
+                phase, r, g, b = _mean_and_predict(
+                    buf, self._bbox['width'], self._bbox['height'], self._stride, self._centers
+                )
+                rgb = (r, g, b)
+            else:
+                rgb = self._get_mean_rgb(buf)
+                phase = self._predict_phase(rgb)
             
             # Validate phase is within enum range
-            if not self._is_valid_phase(phase):
-                if AppConstants.debug:
-                    self.logger.warning(f"Invalid phase {phase}, RGB: {rgb}")
+            if not self._all_clusters_valid and not self._is_valid_phase(phase):
+                if _DEBUG:
+                    self.logger.warning("Invalid phase %s, RGB: %s", phase, rgb)
                 return None
             
-            if AppConstants.debug:
-                self.logger.debug(f"RGB: {rgb}, Phase: {GamePhase(phase).name}")
+            if _DEBUG:
+                self.logger.debug("RGB: %s, Phase: %s", rgb, GamePhase(phase).name)
             
             return {'phase': phase}
             
         except Exception as e:
-            if AppConstants.debug:
-                self.logger.error(f"Error detecting phase: {e}")
+            if _DEBUG:
+                self.logger.error("Error detecting phase: %s", e)
             return None
     
-    def _get_mean_rgb(self) -> Optional[np.ndarray]:
-        """Capture region and calculate mean RGB color"""
+    def set_region(self, region: Dict[str, int]) -> None:
+        """Set capture region (rebuilds the cached bbox and frame buffer)"""
+        self._bbox = {
+            'top': region['top'],
+            'left': region['left'],
+            'width': region['width'],
+            'height': region['height']
+        }
+        
+        # Mean color is stable under uniform subsampling; small regions use all pixels
+        self._stride = max(1, min(
+            config.collection.phase_stride,
+            min(region['height'], region['width']) // 16
+        ))
+        
+        # Reused for batch sub-views (non-contiguous) - no per-frame allocation
+        self._frame_buf = np.empty((region['height'], region['width'], 4), dtype=np.uint8)
+    
+    def capture_bbox(self) -> Dict[str, int]:
+        return self._bbox
+    
+    def set_frame(self, frame: Optional[np.ndarray]) -> None:
+        self._frame = frame
+    
+    def _capture_raw(self) -> Optional[np.ndarray]:
+        """Capture region as a flat uint8 BGRA buffer (no copy)"""
         try:
-            if self._sct is None:
-                self._sct = mss.mss()
+            if self._frame is not None:
+                # Sub-view of a RegionBatch capture - consume once
+                np.copyto(self._frame_buf, self._frame)
+                self._frame = None
+                return self._frame_buf.reshape(-1)
             
-            bbox = {
-                'top': self.screen_reader.region['top'],
-                'left': self.screen_reader.region['left'],
-                'width': self.screen_reader.region['width'],
-                'height': self.screen_reader.region['height']
-            }
-            
-            img = np.array(self._sct.grab(bbox))[:, :, :3]
-            mean_color = img.mean(axis=(0, 1))
-            rgb = mean_color[::-1]
-            
-            return rgb.reshape(1, -1)
+            return self._grabber.grab(self._bbox).reshape(-1)
             
         except Exception as e:
-            if AppConstants.debug:
-                self.logger.error(f"Error capturing RGB: {e}")
+            if _DEBUG:
+                self.logger.error("Error capturing RGB: %s", e)
             return None
     
+    def _get_mean_rgb(self, buf: np.ndarray) -> np.ndarray:
+        """Calculate mean RGB color of a raw BGRA buffer (every stride-th row/column)"""
+        # Reduce raw BGRA bytes directly: integer sums, no float image copy
+        step = self._stride
+        pixels = buf.reshape(self._bbox['height'], self._bbox['width'], 4)[::step, ::step, :3]
+        bgr_sums = pixels.sum(axis=(0, 1), dtype=np.uint64)
+        rgb = bgr_sums[::-1] / (pixels.shape[0] * pixels.shape[1])
+        
+        return rgb.reshape(1, -1)
+    
     def _predict_phase(self, rgb: np.ndarray) -> int:
         """
         Predict game phase using K-means model.
         
         CRITICAL FIX: Model returns cluster IDs 0-5 which directly map to GamePhase enum.
         Previously had "+ 1" which caused values 1-6, breaking the enum mapping.
+        
+        Same result as KMeans.predict(rgb)[0] for a single sample,
+        without sklearn's per-call validation overhead.
         """
-        cluster = self.kmeans.predict(rgb)[0]
+        distances = ((self._centers - rgb[0]) ** 2).sum(axis=1)
+        cluster = distances.argmin()
         return int(cluster)  # Direct mapping, NO +1
     
+    def predict_batch(self, rgb_batch: np.ndarray) -> np.ndarray:
+        """
+        Predict phases for many mean colors at once (N x 3 RGB).
+        
+        Uses ||x||^2 + ||c||^2 - 2*x.c so the distance matrix is a single
+        matrix multiply (sgemm) instead of N separate predictions.
+        
+        Returns:
+            Array of N cluster IDs (GamePhase values)
+        """
+        x = np.asarray(rgb_batch, dtype=np.float32).reshape(-1, 3)
+        x_norms = (x ** 2).sum(axis=1)
+        distances = x_norms[:, None] + self._center_norms[None, :] - 2.0 * (x @ self._centers32.T)
+        return distances.argmin(axis=1)
+    
     def _is_valid_phase(self, phase: int) -> bool:
         """Check if phase is a valid GamePhase enum value"""
-        try:
-            GamePhase(phase)
-            return True
-        except ValueError:
-            return False
+        return phase in _VALID_PHASES
     
-    def get_phase(self) -> Optional[GamePhase]:
-        """Get current game phase as enum."""
+    def refresh(self) -> Optional[GamePhase]:
+        """Read the phase now (one capture) and cache it for get_phase() / is_*()."""
         result = self.read_text()
-        if result:
-            return GamePhase(result['phase'])
-        return None
+        self._phase_cache = GamePhase(result['phase']) if result else None
+        self._phase_ts = time.monotonic()
+        return self._phase_cache
+    
+    def get_phase(self) -> Optional[GamePhase]:
+        """Get current game phase as enum (reuses a reading younger than PHASE_TTL)."""
+        if time.monotonic() - self._phase_ts < self.PHASE_TTL:
+            return self._phase_cache
+        return self.refresh()
     
     def is_game_ended(self) -> bool:
         """Check if game has ended (Phase ENDED)"""
         phase = self.get_phase()
-        return phase == GamePhase.ENDED if phase else False
+        return phase == GamePhase.ENDED
     
     def is_game_running(self) -> bool:
         """Check if game is running (SCORE_LOW, SCORE_MID, SCORE_HIGH)"""
         phase = self.get_phase()
-        return phase in [GamePhase.SCORE_LOW, GamePhase.SCORE_MID, GamePhase.SCORE_HIGH] if phase else False
+        return phase in RUNNING_PHASES
     
     def is_loading(self) -> bool:
         """Check if game is in loading phase (LOADING)"""
         phase = self.get_phase()
-        return phase == GamePhase.LOADING if phase else False
+        return phase == GamePhase.LOADING
     
     def is_betting_time(self) -> bool:
         """Check if in betting time (BETTING)"""
         phase = self.get_phase()
-        return phase == GamePhase.BETTING if phase else False
+        return phase == GamePhase.BETTING
     
     def close(self) -> None:
         """Clean up resources"""
-        if self._sct:
-            self._sct.close()
-            self._sct = None
\ No newline at end of file
+        # Shared with RegionBatch - released at process exit
+        self._grabber = None
\ No newline at end of file
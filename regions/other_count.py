@@ -1,47 +1,50 @@
 # regions/other_count.py
-# VERSION: 5.0
-# CHANGES: Advanced OCR integration
+# VERSION: 5.2
+# CHANGES: Getters reuse a reading from the same tick
 
 from core.screen_reader import ScreenReader
-from regions.base_region import Region
-from logger import AviatorLogger
+from regions.base_region import OcrRegion
 from typing import Optional, Tuple
+import time
 
 
-class OtherCount(Region):
+class OtherCount(OcrRegion):
     """
-    Player count reader with advanced OCR.
-    VERSION: 5.0
+    Player count reader with advanced OCR (tiny "X/Y" text).
+    VERSION: 5.2
     """
     
+    OCR_TYPE = 'player_count'
+    LABEL = 'Player count'
+    
+    # Getters reuse a reading this recent instead of running OCR again
+    CACHE_WINDOW = 0.05  # seconds
+    
     def __init__(self, screen_reader: ScreenReader):
         super().__init__(screen_reader)
-        self.logger = AviatorLogger.get_logger("OtherCount")
-        
-        # Set OCR type for tiny player count text
-        self.screen_reader.ocr_type = 'player_count'
+        self._last = None
+        self._last_ts = 0.0
     
     def read_text(self) -> Optional[Tuple[int, int]]:
         """Read player count using advanced OCR."""
-        try:
-            result = self.screen_reader.read_with_advanced_ocr('player_count')
-            
-            if result is not None:
-                current, total = result
-                self.logger.debug(f"Player count: {current}/{total}")
-            
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error reading player count: {e}")
-            return None
+        result = super().read_text()
+        if result is not None:
+            self._last = result
+            self._last_ts = time.monotonic()
+        return result
+    
+    def _recent(self) -> Optional[Tuple[int, int]]:
+        """Last reading if within CACHE_WINDOW, else a fresh one."""
+        if self._last is not None and time.monotonic() - self._last_ts < self.CACHE_WINDOW:
+            return self._last
+        return self.read_text()
     
     def get_current_count(self) -> Optional[int]:
         """Get current player count."""
-        result = self.read_text()
+        result = self._recent()
         return result[0] if result else None
     
     def get_total_count(self) -> Optional[int]:
         """Get total player count."""
-        result = self.read_text()
-        return result[1] if result else None
\ No newline at end of file
+        result = self._recent()
+        return result[1] if result else None
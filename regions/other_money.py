@@ -1,36 +1,15 @@
 # regions/other_money.py
-# VERSION: 5.0
-# CHANGES: Advanced OCR integration
+# VERSION: 5.1
+# CHANGES: Reading logic moved to OcrRegion
 
-from core.screen_reader import ScreenReader
-from regions.base_region import Region
-from logger import AviatorLogger
-from typing import Optional
+from regions.base_region import OcrRegion
 
 
-class OtherMoney(Region):
+class OtherMoney(OcrRegion):
     """
-    Other money reader with advanced OCR.
-    VERSION: 5.0
+    Other money reader with advanced OCR (medium money text).
+    VERSION: 5.1
     """
     
-    def __init__(self, screen_reader: ScreenReader):
-        super().__init__(screen_reader)
-        self.logger = AviatorLogger.get_logger("OtherMoney")
-        
-        # Set OCR type for medium money text
-        self.screen_reader.ocr_type = 'money_medium'
-    
-    def read_text(self) -> Optional[float]:
-        """Read total money using advanced OCR."""
-        try:
-            money = self.screen_reader.read_with_advanced_ocr('money_medium')
-            
-            if money is not None:
-                self.logger.debug(f"Other money: {money:.2f}")
-            
-            return money
-            
-        except Exception as e:
-            self.logger.error(f"Error reading other money: {e}")
-            return None
\ No newline at end of file
+    OCR_TYPE = 'money_medium'
+    LABEL = 'Other money'
@@ -11,6 +11,7 @@ from regions.other_money import OtherMoney
 from regions.my_money import MyMoney
 from logger import AviatorLogger
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 
 
@@ -20,6 +21,16 @@ class Score(Region):
     VERSION: 5.0
     """
     
+    # Valid score range [low, high) per running phase
+    PHASE_SCORE_RANGES = {
+        GamePhase.SCORE_LOW: (1.0, 2.0),
+        GamePhase.SCORE_MID: (2.0, 10.0),
+        GamePhase.SCORE_HIGH: (10.0, float('inf')),
+    }
+    
+    # Running-phase ticks served from the last reading before OCR runs again
+    OCR_SKIP_STEADY = 3
+    
     def __init__(
         self,
         screen_reader: ScreenReader,
@@ -38,27 +49,40 @@ class Score(Region):
         
         self.logger = AviatorLogger.get_logger("Score")
         
+        # Steady-phase OCR skipping (see _handle_running_game)
+        self._ocr_skip = 0
+        self._last_phase = None
+        self._last_running_result = None
+        
+        # Side regions are independent OCR calls (Tesseract runs as a subprocess),
+        # read in parallel at round end - pool created on first use, see close()
+        self._side_read_pool: Optional[ThreadPoolExecutor] = None
+        
         # Set OCR type for score
         self.screen_reader.ocr_type = 'score'
+        
+        # Phase -> handler, built once (one dict lookup per read_text call)
+        finished = lambda phase: self._handle_finished_game()
+        starting = lambda phase: self._handle_game_starting()
+        self._dispatch = {
+            GamePhase.ENDED: finished,
+            GamePhase.LOADING: starting,
+            GamePhase.BETTING: starting,
+            GamePhase.SCORE_LOW: self._handle_running_game,
+            GamePhase.SCORE_MID: self._handle_running_game,
+            GamePhase.SCORE_HIGH: self._handle_running_game,
+        }
     
     def read_text(self) -> Optional[Dict]:
         """Read score using advanced OCR."""
         try:
             phase = self.phase_detector.get_phase()
             
-            if phase == GamePhase.ENDED:
-                return self._handle_finished_game()
-            
-            elif phase in [GamePhase.LOADING, GamePhase.BETTING]:
-                return self._handle_game_starting()
-            
-            elif phase in [GamePhase.SCORE_LOW, GamePhase.SCORE_MID, GamePhase.SCORE_HIGH]:
-                return self._handle_running_game(phase)
-            
-            return None
+            handler = self._dispatch.get(phase)
+            return handler(phase) if handler else None
             
         except Exception as e:
-            self.logger.error(f"Error reading score: {e}")
+            self.logger.error("Error reading score: %s", e)
             return None
     
     def _handle_finished_game(self) -> Optional[Dict]:
@@ -73,18 +97,26 @@ class Score(Region):
             
             # Validate score is in reasonable range for finished game
             if not (1.0 <= score <= 1000.0):
-                self.logger.warning(f"Suspicious final score: {score}")
+                self.logger.warning("Suspicious final score: %s", score)
                 return None
             
             result = score >= self.auto_stop
-            money = self.my_money.read_text()
-            total_players = self.other_count.get_total_count()
-            total_win = self.other_money.read_text()
+            
+            # Read side regions concurrently - latency is max, not sum, of the three
+            if self._side_read_pool is None:
+                self._side_read_pool = ThreadPoolExecutor(
+                    max_workers=3, thread_name_prefix="ScoreSideRead"
+                )
+            f_money = self._side_read_pool.submit(self.my_money.read_text)
+            f_players = self._side_read_pool.submit(self.other_count.get_total_count)
+            f_win = self._side_read_pool.submit(self.other_money.read_text)
+            money = f_money.result()
+            total_players = f_players.result()
+            total_win = f_win.result()
             
             self.logger.info(
-                f"Game ended - Score: {score:.2f}x, "
-                f"Result: {'WIN' if result else 'LOSS'}, "
-                f"Money: {money}"
+                "Game ended - Score: %.2fx, Result: %s, Money: %s",
+                score, 'WIN' if result else 'LOSS', money
             )
             
             return {
@@ -96,42 +128,55 @@ class Score(Region):
             }
             
         except Exception as e:
-            self.logger.error(f"Error handling finished game: {e}")
+            self.logger.error("Error handling finished game: %s", e)
             return None
     
+    def _handle_game_starting(self) -> Optional[Dict]:
+        """New round is starting - cached OCR results belong to the previous one."""
+        self.screen_reader.clear_ocr_cache()
+        self._ocr_skip = 0
+        self._last_phase = None
+        return None
+    
     def _handle_running_game(self, phase: GamePhase) -> Optional[Dict]:
         """Handle running game with advanced OCR."""
         try:
+            # Same phase as the last reading - reuse it for a few ticks; phase edges always read
+            if self._ocr_skip > 0 and phase == self._last_phase:
+                self._ocr_skip -= 1
+                return self._last_running_result
+            
             score = self.screen_reader.read_with_advanced_ocr('score')
             
             if score is None:
                 return None
             
-            # Validate score matches phase
-            if not self._validate_score_phase(score, phase):
+            # Validate score matches phase (only SCORE_* phases are dispatched here)
+            low, high = self.PHASE_SCORE_RANGES[phase]
+            if not low <= score < high:
                 self.logger.warning(
-                    f"Score {score:.2f} doesn't match phase {phase.name}"
+                    "Score %.2f doesn't match phase %s", score, phase.name
                 )
                 return None
             
             # Check thresholds...
             # (rest of logic stays the same)
             
-            return {
+            result = {
                 'current_score': score,
                 'phase': phase.name
             }
             
+            self._last_phase = phase
+            self._last_running_result = result
+            self._ocr_skip = self.OCR_SKIP_STEADY
+            return result
+            
         except Exception as e:
-            self.logger.error(f"Error handling running game: {e}")
-            return None
-    
-    def _validate_score_phase(self, score: float, phase: GamePhase) -> bool:
-        """Validate score matches expected phase."""
-        if phase == GamePhase.SCORE_LOW:
-            return 1.0 <= score < 2.0
-        elif phase == GamePhase.SCORE_MID:
-            return 2.0 <= score < 10.0
-        elif phase == GamePhase.SCORE_HIGH:
-            return score >= 10.0
-        return False
\ No newline at end of file
+            self.logger.error("Error handling running game: %s", e)
+            return None    
+    def close(self) -> None:
+        """Shut down the side-read pool"""
+        if self._side_read_pool is not None:
+            self._side_read_pool.shutdown(wait=True)
+            self._side_read_pool = None
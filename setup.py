@@ -4,6 +4,7 @@
 
 import sys
 import subprocess
+import importlib.util
 from pathlib import Path
 from typing import List, Tuple
 
@@ -17,7 +18,8 @@ from core.coord_manager import CoordsManager
 class SystemSetup:
     """System setup and verification."""
     
-    def __init__(self):
+    def __init__(self, deep: bool = False):
+        self.deep = deep  # Import dependencies (loads native libs) instead of only locating them
         self.issues: List[str] = []
         self.warnings: List[str] = []
         self.success: List[str] = []
@@ -56,11 +58,20 @@ class SystemSetup:
         all_ok = True
         
         for module in required:
-            try:
-                __import__(module)
+            if self.deep:
+                try:
+                    __import__(module)
+                    found = True
+                except ImportError:
+                    found = False
+            else:
+                # Locate only - no cv2/numpy/sklearn shared libraries get loaded
+                found = importlib.util.find_spec(module) is not None
+            
+            if found:
                 print(f"   ✅ {module}")
                 self.success.append(f"{module} installed")
-            except ImportError:
+            else:
                 print(f"   ❌ {module} NOT INSTALLED")
                 self.issues.append(f"{module} missing")
                 all_ok = False
@@ -317,11 +328,13 @@ if __name__ == "__main__":
                         help='Run interactive setup wizard')
     parser.add_argument('--quick', '-q', action='store_true',
                         help='Quick check only (no fixes)')
+    parser.add_argument('--deep', action='store_true',
+                        help='Import dependencies to verify they load (slower)')
     
     args = parser.parse_args()
     
     if args.interactive:
         interactive_setup()
     else:
-        setup = SystemSetup()
+        setup = SystemSetup(deep=args.deep)
         setup.run()
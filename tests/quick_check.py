@@ -5,6 +5,74 @@ import sqlite3
 import sys
 
 
+# data.db queries
+SQL_READINGS_TOTAL = "SELECT COUNT(*) FROM readings"
+SQL_READINGS_PER_BOOKMAKER = """
+    SELECT bookmaker, COUNT(*) as count 
+    FROM readings 
+    GROUP BY bookmaker 
+    ORDER BY count DESC
+"""
+SQL_READINGS_PER_PHASE = """
+    SELECT game_phase, COUNT(*) as count 
+    FROM readings 
+    WHERE game_phase IS NOT NULL
+    GROUP BY game_phase 
+    ORDER BY count DESC
+"""
+SQL_READINGS_FIRST = """
+    SELECT id, timestamp, bookmaker, score, game_phase 
+    FROM readings 
+    ORDER BY id ASC 
+    LIMIT 10
+"""
+SQL_READINGS_LAST = """
+    SELECT id, timestamp, bookmaker, score, game_phase 
+    FROM readings 
+    ORDER BY id DESC 
+    LIMIT 10
+"""
+
+# game_phase.db queries
+SQL_COLORS_TOTAL = "SELECT COUNT(*) FROM colors"
+SQL_COLORS_PER_BOOKMAKER = """
+    SELECT bookmaker, COUNT(*) as count 
+    FROM colors 
+    GROUP BY bookmaker 
+    ORDER BY count DESC
+"""
+SQL_COLORS_PER_PHASE = """
+    SELECT predicted_phase, COUNT(*) as count,
+           ROUND(AVG(r), 1) as avg_r,
+           ROUND(AVG(g), 1) as avg_g,
+           ROUND(AVG(b), 1) as avg_b
+    FROM colors 
+    WHERE predicted_phase IS NOT NULL
+    GROUP BY predicted_phase 
+    ORDER BY count DESC
+"""
+SQL_COLORS_LAST = """
+    SELECT id, bookmaker, 
+           ROUND(r, 1) as r, ROUND(g, 1) as g, ROUND(b, 1) as b,
+           predicted_phase
+    FROM colors 
+    ORDER BY id DESC 
+    LIMIT 10
+"""
+
+
+def connect_readonly(path: str) -> sqlite3.Connection:
+    """
+    Open database read-only inside one read transaction.
+    
+    Never creates an empty file for a missing database, and all
+    queries see one snapshot under a single shared lock.
+    """
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, isolation_level=None)
+    conn.execute("BEGIN")
+    return conn
+
+
 def check_data_db():
     """Check data.db readings."""
     print("\n" + "="*70)
@@ -12,11 +80,11 @@ def check_data_db():
     print("="*70)
     
     try:
-        conn = sqlite3.connect('data.db')
+        conn = connect_readonly('data.db')
         cursor = conn.cursor()
         
         # Total count
-        cursor.execute("SELECT COUNT(*) FROM readings")
+        cursor.execute(SQL_READINGS_TOTAL)
         total = cursor.fetchone()[0]
         print(f"\nTOTAL READINGS: {total}")
         
@@ -27,24 +95,13 @@ def check_data_db():
         
         # Per bookmaker
         print("\nPER BOOKMAKER:")
-        cursor.execute("""
-            SELECT bookmaker, COUNT(*) as count 
-            FROM readings 
-            GROUP BY bookmaker 
-            ORDER BY count DESC
-        """)
+        cursor.execute(SQL_READINGS_PER_BOOKMAKER)
         for row in cursor.fetchall():
             print(f"  {row[0]}: {row[1]} readings")
         
         # Phase distribution
         print("\nPHASE DISTRIBUTION:")
-        cursor.execute("""
-            SELECT game_phase, COUNT(*) as count 
-            FROM readings 
-            WHERE game_phase IS NOT NULL
-            GROUP BY game_phase 
-            ORDER BY count DESC
-        """)
+        cursor.execute(SQL_READINGS_PER_PHASE)
         for row in cursor.fetchall():
             print(f"  {row[0]}: {row[1]}")
         
@@ -52,12 +109,7 @@ def check_data_db():
         print("\n" + "-"*70)
         print("FIRST 10 READINGS:")
         print("-"*70)
-        cursor.execute("""
-            SELECT id, timestamp, bookmaker, score, game_phase 
-            FROM readings 
-            ORDER BY id ASC 
-            LIMIT 10
-        """)
+        cursor.execute(SQL_READINGS_FIRST)
         for row in cursor.fetchall():
             print(f"#{row[0]}: {row[2]} | {row[4]} | Score: {row[3]} | {row[1]}")
         
@@ -65,12 +117,7 @@ def check_data_db():
         print("\n" + "-"*70)
         print("LAST 10 READINGS:")
         print("-"*70)
-        cursor.execute("""
-            SELECT id, timestamp, bookmaker, score, game_phase 
-            FROM readings 
-            ORDER BY id DESC 
-            LIMIT 10
-        """)
+        cursor.execute(SQL_READINGS_LAST)
         for row in cursor.fetchall():
             print(f"#{row[0]}: {row[2]} | {row[4]} | Score: {row[3]} | {row[1]}")
         
@@ -87,11 +134,11 @@ def check_game_phase_db():
     print("="*70)
     
     try:
-        conn = sqlite3.connect('game_phase.db')
+        conn = connect_readonly('game_phase.db')
         cursor = conn.cursor()
         
         # Total count
-        cursor.execute("SELECT COUNT(*) FROM colors")
+        cursor.execute(SQL_COLORS_TOTAL)
         total = cursor.fetchone()[0]
         print(f"\nTOTAL RGB SAMPLES: {total}")
         
@@ -102,27 +149,13 @@ def check_game_phase_db():
         
         # Per bookmaker
         print("\nPER BOOKMAKER:")
-        cursor.execute("""
-            SELECT bookmaker, COUNT(*) as count 
-            FROM colors 
-            GROUP BY bookmaker 
-            ORDER BY count DESC
-        """)
+        cursor.execute(SQL_COLORS_PER_BOOKMAKER)
         for row in cursor.fetchall():
             print(f"  {row[0]}: {row[1]} samples")
         
         # Per phase
         print("\nPER PREDICTED PHASE:")
-        cursor.execute("""
-            SELECT predicted_phase, COUNT(*) as count,
-                   ROUND(AVG(r), 1) as avg_r,
-                   ROUND(AVG(g), 1) as avg_g,
-                   ROUND(AVG(b), 1) as avg_b
-            FROM colors 
-            WHERE predicted_phase IS NOT NULL
-            GROUP BY predicted_phase 
-            ORDER BY count DESC
-        """)
+        cursor.execute(SQL_COLORS_PER_PHASE)
         for row in cursor.fetchall():
             print(f"  {row[0]}: {row[1]} samples | RGB avg: ({row[2]}, {row[3]}, {row[4]})")
         
@@ -130,14 +163,7 @@ def check_game_phase_db():
         print("\n" + "-"*70)
         print("LAST 10 RGB SAMPLES:")
         print("-"*70)
-        cursor.execute("""
-            SELECT id, bookmaker, 
-                   ROUND(r, 1) as r, ROUND(g, 1) as g, ROUND(b, 1) as b,
-                   predicted_phase
-            FROM colors 
-            ORDER BY id DESC 
-            LIMIT 10
-        """)
+        cursor.execute(SQL_COLORS_LAST)
         for row in cursor.fetchall():
             print(f"#{row[0]}: {row[1]} | RGB: ({row[2]}, {row[3]}, {row[4]}) | {row[5]}")
         
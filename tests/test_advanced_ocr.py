@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
 # test_advanced.py - Quick test for advanced OCR
 
+import gc
+import os
 import sys
+import argparse
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.number_extractor_advanced import quick_extract, AdvancedNumberExtractor
+from utils.number_extractor_advanced import AdvancedNumberExtractor
+from utils.paddleocr_extractor import PADDLEOCR_AVAILABLE
 from pathlib import Path
 
 # ====================================================================
@@ -17,10 +24,33 @@ image_path = "C:/Users/vurun/OneDrive/Pictures/Screenshots/1.png"
 # Expected count (for validation)
 expected_count = 60  # Koliko brojeva očekuješ
 
+# Command line / environment overrides (run without prompts)
+parser = argparse.ArgumentParser(description='Advanced OCR quick test')
+parser.add_argument('--image', default=os.environ.get('GMBL_TEST_IMAGE', image_path))
+parser.add_argument('--expected', type=int, default=expected_count)
+export_group = parser.add_mutually_exclusive_group()
+export_group.add_argument('--export', dest='export', action='store_true', default=None,
+                          help='Export best result without asking')
+export_group.add_argument('--no-export', dest='export', action='store_false',
+                          help='Skip export without asking')
+args, _ = parser.parse_known_args()
+
+image_path = args.image
+expected_count = args.expected
+
+# One extractor shared by all tests
+extractor = AdvancedNumberExtractor()
+
 
 # ====================================================================
 # HELPER: Calculate accuracy
 # ====================================================================
+QUALITY_PERFECT = "100% PERFECT COUNT! ✅"
+QUALITY_FALSE_POSITIVES = "%.1f%% (but %d FALSE POSITIVES! ⚠️)"
+QUALITY_MISSING = "%.1f%% (%d missing)"
+
+
+@lru_cache(maxsize=None)
 def calculate_accuracy(found: int, expected: int) -> tuple:
     """
     Calculate accuracy properly.
@@ -39,22 +69,29 @@ def calculate_accuracy(found: int, expected: int) -> tuple:
         # False positives detected
         false_positives = found - expected
         accuracy = max(0, 100 - (false_positives / expected * 100))
-        quality = f"{accuracy:.1f}% (but {false_positives} FALSE POSITIVES! ⚠️)"
+        quality = QUALITY_FALSE_POSITIVES % (accuracy, false_positives)
         is_good = False  # False positives are BAD
     elif found == expected:
         accuracy = 100.0
-        quality = "100% PERFECT COUNT! ✅"
+        quality = QUALITY_PERFECT
         is_good = True
     else:
         # Missing numbers
         accuracy = (found / expected) * 100
         missing = expected - found
-        quality = f"{accuracy:.1f}% ({missing} missing)"
+        quality = QUALITY_MISSING % (accuracy, missing)
         is_good = (accuracy >= 90)  # 90%+ is acceptable
     
     return accuracy, quality, is_good
 
 
+def print_numbers(nums, indent: str = "      ", per_row: int = 10) -> None:
+    """Print numbers as rows of "  1.23x" (formatted in one vectorized pass)"""
+    formatted = np.char.mod('%7.2fx', np.asarray(nums, dtype=np.float64))
+    for i in range(0, len(formatted), per_row):
+        print(indent + "  ".join(formatted[i:i+per_row]))
+
+
 # ====================================================================
 # TEST 1: BEST METHOD (most numbers found)
 # ====================================================================
@@ -62,7 +99,7 @@ print("\n" + "="*70)
 print("TEST 1: BEST METHOD (automatic)")
 print("="*70)
 
-numbers = quick_extract(image_path, method='best', debug=True)
+numbers = extractor.extract_best(image_path, debug=True, expected_count=expected_count)
 
 accuracy, quality, is_good = calculate_accuracy(len(numbers), expected_count)
 print(f"\n📊 Result: {len(numbers)}/{expected_count} numbers")
@@ -70,9 +107,7 @@ print(f"   Quality: {quality}")
 
 if numbers:
     print("\n   ALL NUMBERS FOUND:")
-    for i in range(0, len(numbers), 10):
-        row = numbers[i:i+10]
-        print("      " + "  ".join(f"{n:7.2f}x" for n in row))
+    print_numbers(numbers)
 
 
 # ====================================================================
@@ -82,7 +117,7 @@ print("\n\n" + "="*70)
 print("TEST 2: COMBINED METHOD (merge all)")
 print("="*70)
 
-numbers_combined = quick_extract(image_path, method='combined', debug=False)
+numbers_combined = extractor.extract_combined(image_path, debug=False)
 
 accuracy, quality, is_good = calculate_accuracy(len(numbers_combined), expected_count)
 print(f"\n📊 Result: {len(numbers_combined)}/{expected_count} numbers")
@@ -90,9 +125,7 @@ print(f"   Quality: {quality}")
 
 if numbers_combined:
     print("\n   ALL NUMBERS FOUND:")
-    for i in range(0, len(numbers_combined), 10):
-        row = numbers_combined[i:i+10]
-        print("      " + "  ".join(f"{n:7.2f}x" for n in row))
+    print_numbers(numbers_combined)
 
 
 # ====================================================================
@@ -102,7 +135,6 @@ print("\n\n" + "="*70)
 print("TEST 3: METHOD COMPARISON")
 print("="*70)
 
-extractor = AdvancedNumberExtractor()
 all_results = extractor.extract_multi_method(image_path, debug=False)
 
 print("\nResults by method:")
@@ -115,6 +147,20 @@ for method, nums in all_results.items():
     method_scores.append((method, len(nums), accuracy, is_good))
     print(f"{method:<15} {len(nums):<6} {expected_count:<10} {quality}")
 
+# Optional third engine - competes in the best-result selection below
+paddle_results = {}
+if PADDLEOCR_AVAILABLE:
+    from utils.paddleocr_extractor import get_extractor as get_paddle_extractor
+    
+    try:
+        paddle_numbers = get_paddle_extractor().extract(image_path)
+        paddle_results['paddleocr'] = paddle_numbers
+        
+        accuracy, quality, is_good = calculate_accuracy(len(paddle_numbers), expected_count)
+        print(f"{'paddleocr':<15} {len(paddle_numbers):<6} {expected_count:<10} {quality}")
+    except Exception as e:
+        print(f"{'paddleocr':<15} ❌ Error: {e}")
+
 
 # ====================================================================
 # FIND BEST RESULT (closest to expected, not most numbers!)
@@ -153,10 +199,12 @@ def find_best_result(results_dict, expected):
 all_results_dict = {
     'best_method': numbers,
     'combined': numbers_combined,
-    **all_results
+    **all_results,
+    **paddle_results
 }
 
 best_result, best_name = find_best_result(all_results_dict, expected_count)
+best_array = np.asarray(best_result, dtype=np.float64)
 
 print("\n" + "="*70)
 print("✅ BEST RESULT (closest to expected)")
@@ -169,9 +217,7 @@ print(f"Quality: {quality}")
 
 # Show ALL numbers
 print("\nALL NUMBERS FROM BEST METHOD:")
-for i in range(0, len(best_result), 10):
-    row = best_result[i:i+10]
-    print("   " + "  ".join(f"{n:7.2f}x" for n in row))
+print_numbers(best_array, indent="   ")
 
 # Rating
 diff = abs(len(best_result) - expected_count)
@@ -195,26 +241,34 @@ if len(best_result) > expected_count:
 print(f"\n💾 Debug images saved to: {Path(image_path).parent / 'debug'}")
 print("="*70)
 
+# Only best_result is needed from here on - release the per-method results
+# and the extractor's cached copies before waiting on the export prompt
+del numbers, numbers_combined, all_results, paddle_results, all_results_dict
+extractor.clear_cache()
+gc.collect()
+
 
 # ====================================================================
 # EXPORT
 # ====================================================================
-export = input("\n💾 Export best result to file? (yes/no): ").strip().lower()
+if args.export is None:
+    export = input("\n💾 Export best result to file? (yes/no): ").strip().lower() in ['yes', 'y']
+else:
+    export = args.export
 
-if export in ['yes', 'y']:
+if export:
     output_file = "extracted_numbers.txt"
     
     with open(output_file, 'w') as f:
         f.write(f"Extracted Numbers ({len(best_result)}/{expected_count})\n")
         f.write("="*70 + "\n\n")
         
-        for num in best_result:
-            f.write(f"{num}\n")
+        f.writelines(f"{num}\n" for num in best_result)
         
         f.write(f"\nStatistics:\n")
-        f.write(f"Count: {len(best_result)}\n")
-        f.write(f"Min: {min(best_result):.2f}\n")
-        f.write(f"Max: {max(best_result):.2f}\n")
-        f.write(f"Avg: {sum(best_result)/len(best_result):.2f}\n")
+        f.write(f"Count: {best_array.size}\n")
+        f.write(f"Min: {best_array.min():.2f}\n")
+        f.write(f"Max: {best_array.max():.2f}\n")
+        f.write(f"Avg: {best_array.mean():.2f}\n")
     
     print(f"✅ Exported to: {output_file}")
\ No newline at end of file
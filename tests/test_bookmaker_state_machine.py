@@ -0,0 +1,97 @@
+# tests/test_bookmaker_state_machine.py
+# Phase state machine of BookmakerProcess (no screen capture, no OCR)
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Third-party modules the region readers import - skip where they aren't installed
+for module in ("numpy", "cv2", "mss", "pytesseract"):
+    pytest.importorskip(module)
+
+from core import bookmaker_process
+from config import GamePhase
+from regions.game_phase import GamePhaseDetector
+
+
+class FakePhaseDetector:
+    """Returns a fixed sequence of phases, one per get_phase() call."""
+    
+    def __init__(self, phases):
+        self._phases = iter(phases)
+    
+    def get_phase(self):
+        return next(self._phases)
+
+
+def make_process(phases):
+    process = bookmaker_process.BookmakerProcess(
+        bookmaker_name="Test",
+        auto_stop=2.0,
+        target_money=1000.0,
+        betting_queue=None,
+        db_queue=None,
+        shutdown_event=None,
+        play_amount_coords=(0, 0),
+        play_button_coords=(0, 0),
+        bet_sequence=[10, 20],
+        score_region={},
+        my_money_region={},
+        other_count_region={},
+        other_money_region={},
+        phase_region={}
+    )
+    process.phase_detector = FakePhaseDetector(phases)
+    process.logger = bookmaker_process.AviatorLogger.get_logger("Test")
+    return process
+
+
+def test_ended_reaches_round_end(monkeypatch):
+    """ENDED is cluster 0 (falsy) - it must still trigger _handle_round_end once."""
+    process = make_process([GamePhase.SCORE_LOW, GamePhase.ENDED, GamePhase.ENDED])
+    calls = []
+    monkeypatch.setattr(process, "_handle_round_end", lambda: calls.append(process.current_phase))
+    monkeypatch.setattr(process, "_collect_snapshot", lambda: None)
+    
+    for _ in range(3):
+        process._state_machine_loop()
+    
+    assert calls == [GamePhase.ENDED]
+
+
+def test_loading_after_ended_places_bet(monkeypatch):
+    process = make_process([GamePhase.ENDED, GamePhase.LOADING])
+    bets = []
+    monkeypatch.setattr(process, "_handle_round_end", lambda: None)
+    monkeypatch.setattr(process, "_place_bet_once", lambda: bets.append(process.current_phase))
+    
+    process._state_machine_loop()
+    process._state_machine_loop()
+    
+    assert bets == [GamePhase.LOADING]
+
+
+def test_no_reading_is_ignored(monkeypatch):
+    process = make_process([None])
+    monkeypatch.setattr(process, "_handle_round_end", lambda: pytest.fail("no phase read"))
+    
+    process._state_machine_loop()
+    
+    assert process.current_phase is None
+
+
+@pytest.mark.parametrize("phase, check", [
+    (GamePhase.ENDED, "is_game_ended"),
+    (GamePhase.LOADING, "is_loading"),
+    (GamePhase.BETTING, "is_betting_time"),
+])
+def test_detector_phase_checks(monkeypatch, phase, check):
+    detector = GamePhaseDetector.__new__(GamePhaseDetector)
+    monkeypatch.setattr(detector, "get_phase", lambda: phase)
+    assert getattr(detector, check)() is True
+    
+    monkeypatch.setattr(detector, "get_phase", lambda: None)
+    assert getattr(detector, check)() is False
@@ -4,6 +4,9 @@
 import sys
 from pathlib import Path
 
+import cv2
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # ====================================================================
@@ -23,30 +26,48 @@ expected_numbers = [
 ]
 
 
+# Decode once - both engines get the same array (no re-read per engine)
+try:
+    image = cv2.imdecode(np.fromfile(image_path, dtype=np.uint8), cv2.IMREAD_COLOR)
+except OSError:
+    image = None
+image_source = image if image is not None else image_path  # path -> engines report the load error
+
+
 # ====================================================================
 # HELPER FUNCTIONS
 # ====================================================================
+def has_close(values: np.ndarray, reference: np.ndarray, tol: float = 0.01) -> np.ndarray:
+    """
+    For each value: is any reference value within tol?
+    
+    Only the nearest neighbours in sorted order can match, so this is a
+    binary search per value - O((N+M) log M), no N x M matrix.
+    """
+    if not reference.size:
+        return np.zeros(values.shape, dtype=bool)
+    
+    ref = np.sort(reference)
+    idx = np.searchsorted(ref, values)
+    below = ref[np.maximum(idx - 1, 0)]
+    above = ref[np.minimum(idx, ref.size - 1)]
+    return (np.abs(values - below) < tol) | (np.abs(values - above) < tol)
+
+
 def calculate_match_score(extracted: list, expected: list) -> tuple:
     """
     Calculate how many numbers match.
     
     Returns: (matched, missing, false_positives)
     """
-    matched = 0
-    missing = []
-    false_positives = []
-    
-    # Check matches
-    for exp_num in expected:
-        if any(abs(exp_num - ext) < 0.01 for ext in extracted):
-            matched += 1
-        else:
-            missing.append(exp_num)
-    
-    # Check false positives
-    for ext_num in extracted:
-        if not any(abs(ext_num - exp) < 0.01 for exp in expected):
-            false_positives.append(ext_num)
+    exp = np.asarray(expected, dtype=np.float64)
+    ext = np.asarray(extracted, dtype=np.float64)
+    
+    found = has_close(exp, ext)
+    
+    matched = int(found.sum())
+    missing = exp[~found].tolist()
+    false_positives = ext[~has_close(ext, exp)].tolist()
     
     return matched, missing, false_positives
 
@@ -59,13 +80,13 @@ print("🔵 TEST 1: EasyOCR")
 print("="*70)
 
 try:
-    from utils.easyocr_extractor import EasyOCRExtractor
+    from utils.easyocr_extractor import get_extractor as get_easyocr_extractor
     
     print("\n🔧 Initializing EasyOCR (first time takes 10-20 seconds)...")
-    extractor_easy = EasyOCRExtractor(use_gpu=False)
+    extractor_easy = get_easyocr_extractor(use_gpu=False)
     
     print(f"📷 Processing: {image_path}")
-    easy_numbers = extractor_easy.extract(image_path, enhance=True, debug=True)
+    easy_numbers = extractor_easy.extract(image_source, enhance=True, debug=True)
     
     print(f"\n📊 EasyOCR Results:")
     print(f"   Found: {len(easy_numbers)}/{expected_count} numbers")
@@ -107,12 +128,12 @@ print("🔴 TEST 2: Tesseract")
 print("="*70)
 
 try:
-    from utils.number_extractor_advanced import AdvancedNumberExtractor
+    from utils.number_extractor_advanced import get_extractor as get_tesseract_extractor
     
-    extractor_tess = AdvancedNumberExtractor()
+    extractor_tess = get_tesseract_extractor()
     
     print(f"\n📷 Processing: {image_path}")
-    tess_numbers = extractor_tess.extract_best(image_path, debug=True)
+    tess_numbers = extractor_tess.extract_best(image_source, debug=True)
     
     print(f"\n📊 Tesseract Results:")
     print(f"   Found: {len(tess_numbers)}/{expected_count} numbers")
@@ -1,8 +1,11 @@
 # tests/test_number_extraction.py
-# VERSION: 1.0
+# VERSION: 1.1
 # Test script for number extraction
+# CHANGES: Non-interactive mode (--test/--image/--region, GMBL_TEST_IMAGE)
 
+import os
 import sys
+import argparse
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -10,14 +13,23 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.number_extractor import NumberExtractor, quick_extract
 
 
-def test_basic_extraction():
+# Image used when --image is not given (skips the prompt)
+IMAGE_ENV = 'GMBL_TEST_IMAGE'
+
+
+def ask_image_path(prompt: str, image_path: str = None) -> str:
+    """Image from argument, then GMBL_TEST_IMAGE, then interactive prompt."""
+    return image_path or os.environ.get(IMAGE_ENV) or input(prompt).strip()
+
+
+def test_basic_extraction(image_path: str = None):
     """Test basic number extraction."""
     print("\n" + "="*60)
     print("TEST: Basic Number Extraction")
     print("="*60)
     
     # Example: test with a screenshot
-    image_path = input("Enter path to image (or press Enter for example): ").strip()
+    image_path = ask_image_path("Enter path to image (or press Enter for example): ", image_path)
     
     if not image_path:
         print("\n⚠️  No image provided. Please provide an image path.")
@@ -62,22 +74,23 @@ def test_basic_extraction():
         print("  - Try adjusting invert parameter")
 
 
-def test_with_region():
+def test_with_region(image_path: str = None, region_str: str = None):
     """Test extraction from specific region."""
     print("\n" + "="*60)
     print("TEST: Region-based Extraction")
     print("="*60)
     
-    image_path = input("Enter path to image: ").strip()
+    image_path = ask_image_path("Enter path to image: ", image_path)
     
     if not Path(image_path).exists():
         print(f"\n❌ Image not found: {image_path}")
         return
     
-    print("\nEnter region coordinates:")
-    print("Format: left,top,width,height")
-    print("Example: 100,200,1200,80")
-    region_str = input("Region: ").strip()
+    if not region_str:
+        print("\nEnter region coordinates:")
+        print("Format: left,top,width,height")
+        print("Example: 100,200,1200,80")
+        region_str = input("Region: ").strip()
     
     try:
         region = tuple(map(int, region_str.split(',')))
@@ -104,7 +117,7 @@ def test_with_region():
             print("  " + "  ".join(f"{n:.2f}x" for n in row))
 
 
-def test_quick_api():
+def test_quick_api(image_path: str = None):
     """Test quick API usage."""
     print("\n" + "="*60)
     print("TEST: Quick API")
@@ -124,20 +137,20 @@ numbers = quick_extract("screenshot.png", debug=True)
     """)
     
     # Try it
-    image_path = input("\nTry it now - enter image path (or press Enter to skip): ").strip()
+    image_path = ask_image_path("\nTry it now - enter image path (or press Enter to skip): ", image_path)
     
     if image_path and Path(image_path).exists():
         numbers = quick_extract(image_path, debug=True)
         print(f"\n✅ Result: {numbers}")
 
 
-def benchmark_preprocessing():
+def benchmark_preprocessing(image_path: str = None):
     """Benchmark different preprocessing parameters."""
     print("\n" + "="*60)
     print("TEST: Preprocessing Benchmark")
     print("="*60)
     
-    image_path = input("Enter path to image: ").strip()
+    image_path = ask_image_path("Enter path to image: ", image_path)
     
     if not Path(image_path).exists():
         print(f"\n❌ Image not found: {image_path}")
@@ -171,40 +184,60 @@ def benchmark_preprocessing():
         print(f"   Numbers: {best[2][:10]}...")  # Show first 10
 
 
+def run_tests(tests, image_path: str = None, region_str: str = None):
+    """Run tests by menu number without prompting for anything already given."""
+    for test in tests:
+        if test == '1':
+            test_basic_extraction(image_path)
+        elif test == '2':
+            test_with_region(image_path, region_str)
+        elif test == '3':
+            test_quick_api(image_path)
+        elif test == '4':
+            benchmark_preprocessing(image_path)
+
+
 def main():
     """Main test menu."""
-    print("\n" + "="*60)
-    print("🧪 NUMBER EXTRACTOR - TEST SUITE")
-    print("="*60)
-    
-    print("\nAvailable tests:")
-    print("  1. Basic extraction")
-    print("  2. Region-based extraction")
-    print("  3. Quick API demo")
-    print("  4. Preprocessing benchmark")
-    print("  5. Exit")
-    
-    choice = input("\nChoice (1-5): ").strip()
-    
-    if choice == '1':
-        test_basic_extraction()
-    elif choice == '2':
-        test_with_region()
-    elif choice == '3':
-        test_quick_api()
-    elif choice == '4':
-        benchmark_preprocessing()
-    elif choice == '5':
-        print("Goodbye!")
-        return
-    else:
-        print("Invalid choice!")
+    parser = argparse.ArgumentParser(description='Number extractor test suite')
+    parser.add_argument('--test', '-t', action='append', choices=['1', '2', '3', '4'],
+                        help='Test to run (repeatable); omit for interactive menu')
+    parser.add_argument('--image', '-i', help=f'Image path (default: ${IMAGE_ENV})')
+    parser.add_argument('--region', '-r', help='Region for test 2: left,top,width,height')
+    args = parser.parse_args()
+    
+    if args.test:
+        run_tests(args.test, args.image, args.region)
         return
     
-    # Ask to run another test
-    again = input("\n\nRun another test? (yes/no): ").strip().lower()
-    if again in ['yes', 'y']:
-        main()
+    # Loop (not recursion) - stays in one frame, loaded extractors are reused
+    while True:
+        print("\n" + "="*60)
+        print("🧪 NUMBER EXTRACTOR - TEST SUITE")
+        print("="*60)
+        
+        print("\nAvailable tests:")
+        print("  1. Basic extraction")
+        print("  2. Region-based extraction")
+        print("  3. Quick API demo")
+        print("  4. Preprocessing benchmark")
+        print("  5. Exit")
+        
+        choice = input("\nChoice (1-5): ").strip()
+        
+        if choice in ('1', '2', '3', '4'):
+            run_tests([choice], args.image, args.region)
+        elif choice == '5':
+            print("Goodbye!")
+            return
+        else:
+            print("Invalid choice!")
+            return
+        
+        # Ask to run another test
+        again = input("\n\nRun another test? (yes/no): ").strip().lower()
+        if again not in ['yes', 'y']:
+            return
 
 
 if __name__ == "__main__":
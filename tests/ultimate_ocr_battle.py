@@ -8,6 +8,12 @@ import re
 from pathlib import Path
 
 
+# Number patterns, compiled once (used per OCR line by every engine)
+NUMBER_RE = re.compile(r'(\d+\.?\d*)')   # 24.10 or 24
+DECIMAL_RE = re.compile(r'(\d+\.\d+)')   # 24.10
+INTEGER_RE = re.compile(r'(\d+)')         # 24
+
+
 # ==================================================================
 # SMART FIX FUNKCIJA
 # ==================================================================
@@ -87,9 +93,10 @@ try:
     # Convert to grayscale
     gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
     
-    # Basic preprocessing
-    gray = cv2.resize(gray, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
+    # Basic preprocessing - Otsu at native resolution, then upscale the binary
+    # image (nearest keeps it two-level, no cubic pass over the 4x buffer)
     _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    binary = cv2.resize(binary, None, fx=2, fy=2, interpolation=cv2.INTER_NEAREST)
     
     # OCR
     config = '--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789.x'
@@ -99,7 +106,7 @@ try:
     tess_raw = []
     for line in text.split('\n'):
         line = line.strip().lower().replace('x', '')
-        matches = re.findall(r'(\d+\.?\d*)', line)
+        matches = NUMBER_RE.findall(line)
         for match in matches:
             try:
                 num = float(match)
@@ -172,7 +179,7 @@ try:
         
         # Extract numbers from text
         text = text.lower().replace('x', '')
-        matches = re.findall(r'(\d+\.?\d*)', text)
+        matches = NUMBER_RE.findall(text)
         
         for match in matches:
             try:
@@ -255,13 +262,8 @@ try:
             
             # Extract numbers from text
             text = text.lower().replace('x', '')
-            patterns = [
-                r'(\d+\.\d+)',  # 24.10
-                r'(\d+)',        # 24
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, text)
+            for pattern in (DECIMAL_RE, INTEGER_RE):
+                matches = pattern.findall(text)
                 for match in matches:
                     try:
                         num = float(match)
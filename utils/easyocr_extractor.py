@@ -1,10 +1,12 @@
 # utils/easyocr_extractor.py
-# VERSION: 1.0 - EasyOCR alternative to Tesseract
+# VERSION: 1.1 - Optional ONNX Runtime backend
 # Often MORE ACCURATE than Tesseract for clean text!
+# CHANGES: backend='onnx' runs the same models via torchfree-ocr (no torch, faster on CPU)
 
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Union
 import cv2
 import numpy as np
 
@@ -16,6 +18,12 @@ except ImportError:
     print("⚠️  EasyOCR not installed!")
     print("   Install with: pip install easyocr")
 
+try:
+    import torchfree_ocr
+    TORCHFREE_AVAILABLE = True
+except ImportError:
+    TORCHFREE_AVAILABLE = False
+
 
 class EasyOCRExtractor:
     """
@@ -26,23 +34,38 @@ class EasyOCRExtractor:
     - Better with colored text
     - More accurate decimal point detection
     - GPU support (faster if you have GPU)
+    
+    backend='onnx' runs the EasyOCR models on ONNX Runtime (torchfree-ocr):
+    CPU only, ~20% faster and without the 1.5 GB torch install. Results
+    keep the same (bbox, text, confidence) shape.
     """
     
-    def __init__(self, use_gpu: bool = False):
+    def __init__(self, use_gpu: bool = False, backend: str = 'torch'):
         """
         Initialize EasyOCR.
         
         Args:
-            use_gpu: Use GPU if available (much faster!)
+            use_gpu: Use GPU if available (much faster!) - torch backend only
+            backend: 'torch' (easyocr) or 'onnx' (torchfree-ocr, CPU)
         """
-        if not EASYOCR_AVAILABLE:
-            raise ImportError("EasyOCR not installed! Run: pip install easyocr")
-        
-        print("🔧 Initializing EasyOCR (this takes 10-20 seconds first time)...")
-        self.reader = easyocr.Reader(['en'], gpu=use_gpu, verbose=False)
+        if backend == 'onnx':
+            if not TORCHFREE_AVAILABLE:
+                raise ImportError("torchfree-ocr not installed! Run: pip install torchfree-ocr")
+            
+            print("🔧 Initializing EasyOCR (ONNX Runtime)...")
+            self.reader = torchfree_ocr.Reader(['en'])
+            use_gpu = False
+        else:
+            if not EASYOCR_AVAILABLE:
+                raise ImportError("EasyOCR not installed! Run: pip install easyocr")
+            
+            print("🔧 Initializing EasyOCR (this takes 10-20 seconds first time)...")
+            # quantize: dynamic INT8 recognizer/detector on CPU (ignored on GPU)
+            self.reader = easyocr.Reader(['en'], gpu=use_gpu, quantize=True, verbose=False)
         print("✅ EasyOCR ready!")
         
         self.use_gpu = use_gpu
+        self.backend = backend
     
     def preprocess_for_easyocr(
         self,
@@ -122,7 +145,7 @@ class EasyOCRExtractor:
     
     def extract(
         self,
-        image_path: str,
+        image_path: Union[str, np.ndarray],
         enhance: bool = True,
         debug: bool = False
     ) -> List[float]:
@@ -130,30 +153,36 @@ class EasyOCRExtractor:
         Extract numbers from image using EasyOCR.
         
         Args:
-            image_path: Path to image
+            image_path: Path to image, or an already decoded BGR image
             enhance: Apply preprocessing
             debug: Save debug images
         
         Returns:
             List of extracted numbers
         """
-        print(f"📷 Loading: {image_path}")
-        
-        # Load image
-        image = cv2.imread(image_path)
-        if image is None:
-            print(f"❌ Could not load: {image_path}")
-            return []
+        if isinstance(image_path, np.ndarray):
+            # Decoded by the caller - debug images go to ./debug_easyocr
+            image = image_path
+            image_dir, image_stem = Path.cwd(), "image"
+        else:
+            print(f"📷 Loading: {image_path}")
+            
+            # Load image
+            image = cv2.imread(image_path)
+            if image is None:
+                print(f"❌ Could not load: {image_path}")
+                return []
+            image_dir, image_stem = Path(image_path).parent, Path(image_path).stem
         
         # Preprocess
         processed = self.preprocess_for_easyocr(image, enhance)
         
         # Debug
         if debug:
-            debug_dir = Path(image_path).parent / "debug_easyocr"
+            debug_dir = image_dir / "debug_easyocr"
             debug_dir.mkdir(exist_ok=True)
             
-            debug_path = debug_dir / f"{Path(image_path).stem}_preprocessed.png"
+            debug_path = debug_dir / f"{image_stem}_preprocessed.png"
             cv2.imwrite(str(debug_path), processed)
             print(f"💾 Debug image: {debug_path}")
         
@@ -258,11 +287,18 @@ class EasyOCRExtractor:
         }
 
 
+@lru_cache(maxsize=4)
+def get_extractor(use_gpu: bool = False, backend: str = 'torch') -> EasyOCRExtractor:
+    """Shared extractor per device/backend - the model loads only once per process."""
+    return EasyOCRExtractor(use_gpu=use_gpu, backend=backend)
+
+
 def quick_extract(
     image_path: str,
     use_gpu: bool = False,
     enhance: bool = True,
-    debug: bool = False
+    debug: bool = False,
+    backend: str = 'torch'
 ) -> List[float]:
     """
     Quick extraction function.
@@ -272,11 +308,12 @@ def quick_extract(
         use_gpu: Use GPU (faster if available)
         enhance: Apply preprocessing
         debug: Save debug images
+        backend: 'torch' or 'onnx'
     
     Returns:
         List of extracted numbers
     """
-    extractor = EasyOCRExtractor(use_gpu=use_gpu)
+    extractor = get_extractor(use_gpu, backend)
     return extractor.extract(image_path, enhance, debug)
 
 
@@ -290,7 +327,7 @@ def compare_with_tesseract(image_path: str, expected_count: int = 60):
     
     # EasyOCR
     print("\n1️⃣  EasyOCR:")
-    easy_extractor = EasyOCRExtractor(use_gpu=False)
+    easy_extractor = get_extractor(use_gpu=False)
     easy_numbers = easy_extractor.extract(image_path, debug=True)
     
     print(f"   Found: {len(easy_numbers)}/{expected_count}")
@@ -299,8 +336,8 @@ def compare_with_tesseract(image_path: str, expected_count: int = 60):
     # Tesseract
     print("\n2️⃣  Tesseract:")
     try:
-        from utils.number_extractor_advanced import AdvancedNumberExtractor
-        tess_extractor = AdvancedNumberExtractor()
+        from utils.number_extractor_advanced import get_extractor as get_advanced_extractor
+        tess_extractor = get_advanced_extractor()
         tess_numbers = tess_extractor.extract_best(image_path, debug=True)
         
         print(f"   Found: {len(tess_numbers)}/{expected_count}")
@@ -337,6 +374,7 @@ def main():
         print("Usage: python easyocr_extractor.py <image_path> [options]")
         print("\nOptions:")
         print("  --gpu          Use GPU (faster)")
+        print("  --onnx         Use ONNX Runtime backend (CPU, no torch)")
         print("  --debug        Save debug images")
         print("  --compare      Compare with Tesseract")
         print("\nExamples:")
@@ -350,13 +388,14 @@ def main():
     use_gpu = '--gpu' in sys.argv
     debug = '--debug' in sys.argv
     compare = '--compare' in sys.argv
+    backend = 'onnx' if '--onnx' in sys.argv else 'torch'
     
     if compare:
         compare_with_tesseract(image_path)
         return
     
     # Extract
-    numbers = quick_extract(image_path, use_gpu, enhance=True, debug=debug)
+    numbers = quick_extract(image_path, use_gpu, enhance=True, debug=debug, backend=backend)
     
     # Display
     print("\n" + "="*70)
@@ -379,7 +418,7 @@ def main():
 
 
 if __name__ == "__main__":
-    if not EASYOCR_AVAILABLE:
+    if not EASYOCR_AVAILABLE and not TORCHFREE_AVAILABLE:
         print("\n" + "="*70)
         print("⚠️  EasyOCR NOT INSTALLED")
         print("="*70)
@@ -197,7 +197,7 @@ class NumberExtractor:
         # OCR
         text = pytesseract.image_to_string(processed, config=self.tesseract_config)
         
-        self.logger.debug(f"Raw OCR text:\n{text}")
+        self.logger.debug("Raw OCR text:\n%s", text)
         
         # Parse numbers
         numbers = self.parse_numbers(text)
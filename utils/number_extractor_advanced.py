@@ -1,10 +1,15 @@
 # utils/number_extractor_advanced.py
-# VERSION: 5.0 - Optimized for colored text
-# Better preprocessing for colored numbers
+# VERSION: 5.1 - Batched OCR
+# CHANGES: All preprocessing methods OCR'd in one Tesseract run per config (multi-page TIFF)
 
 import re
+import atexit
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import Callable, List, Tuple, Dict, Optional, Union
 
 import cv2
 import numpy as np
@@ -12,6 +17,17 @@ import pytesseract
 from PIL import Image
 
 
+# Blob heights (px, before upscaling) treated as possible digits when locating the numbers ROI
+DIGIT_HEIGHT_RANGE = (6, 120)
+ROI_MARGIN = 12
+
+# Debug PNGs are written in the background so OCR doesn't wait on encoding/disk.
+# Fast compression level; pending writes are flushed at exit.
+DEBUG_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+_DEBUG_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="DebugWrite")
+atexit.register(_DEBUG_POOL.shutdown)
+
+
 class AdvancedNumberExtractor:
     """
     Advanced number extractor optimized for colored text.
@@ -48,17 +64,29 @@ class AdvancedNumberExtractor:
         if tesseract_path and Path(tesseract_path).exists():
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
         
-        # Multiple OCR configs to try
+        # Multiple OCR configs to try (LSTM engine only - legacy engine never loaded)
         self.tesseract_configs = [
-            '--psm 6 -c tessedit_char_whitelist=0123456789.x',  # Block of text
-            '--psm 11 -c tessedit_char_whitelist=0123456789.x', # Sparse text
-            '--psm 12 -c tessedit_char_whitelist=0123456789.x', # Sparse text + OSD
+            '--oem 1 --psm 6 -c tessedit_char_whitelist=0123456789.x',  # Block of text
+            '--oem 1 --psm 11 -c tessedit_char_whitelist=0123456789.x', # Sparse text
+            '--oem 1 --psm 12 -c tessedit_char_whitelist=0123456789.x', # Sparse text + OSD
         ]
+        
+        # Built once, shared by every enhance_text() call
+        self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        self._close_kernel = np.ones((2, 2), np.uint8)
+        
+        # (image content hash, configs) -> results per method
+        self._results_cache: Dict[Tuple[str, Tuple[str, ...], bool], Dict[str, List[float]]] = {}
+    
+    def clear_cache(self) -> None:
+        """Forget cached OCR results."""
+        self._results_cache.clear()
     
     def preprocess_colored_text(
         self,
         image: np.ndarray,
-        method: str = 'lightness'
+        method: str = 'lightness',
+        hsv: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
         Preprocess colored text for better OCR.
@@ -66,23 +94,24 @@ class AdvancedNumberExtractor:
         Args:
             image: Input BGR image
             method: 'lightness', 'saturation', 'value', 'channels', 'adaptive'
+            hsv: HSV conversion of image, if already computed (shared across methods)
         
         Returns:
             Preprocessed grayscale image
         """
-        if method == 'lightness':
-            # Convert to HSV and extract lightness (Value channel)
+        if method in ('lightness', 'saturation', 'value') and hsv is None:
             hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        
+        if method == 'lightness':
+            # Extract lightness (Value channel)
             gray = hsv[:, :, 2]  # V channel
         
         elif method == 'saturation':
             # High saturation = colored text
-            hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
             gray = hsv[:, :, 1]  # S channel
         
         elif method == 'value':
             # Combine channels with weighted average
-            hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
             # Emphasize saturated colors
             gray = cv2.addWeighted(hsv[:, :, 2], 0.7, hsv[:, :, 1], 0.3, 0)
         
@@ -101,6 +130,35 @@ class AdvancedNumberExtractor:
         
         return gray
     
+    def detect_numbers_bbox(self, image: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Locate the area containing text-like blobs.
+        
+        Colored text is bright in at least one channel, so the channel max
+        is Otsu-thresholded and the union of digit-sized contours (plus a
+        margin) is returned.
+        
+        Returns:
+            (x, y, w, h) or None if nothing digit-sized was found
+        """
+        bright = image.max(axis=2)
+        _, binary = cv2.threshold(bright, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        
+        min_h, max_h = DIGIT_HEIGHT_RANGE
+        boxes = [cv2.boundingRect(c) for c in contours]
+        boxes = [b for b in boxes if min_h <= b[3] <= max_h]
+        if not boxes:
+            return None
+        
+        img_h, img_w = image.shape[:2]
+        x0 = max(0, min(b[0] for b in boxes) - ROI_MARGIN)
+        y0 = max(0, min(b[1] for b in boxes) - ROI_MARGIN)
+        x1 = min(img_w, max(b[0] + b[2] for b in boxes) + ROI_MARGIN)
+        y1 = min(img_h, max(b[1] + b[3] for b in boxes) + ROI_MARGIN)
+        
+        return x0, y0, x1 - x0, y1 - y0
+    
     def enhance_text(
         self,
         gray: np.ndarray,
@@ -120,8 +178,7 @@ class AdvancedNumberExtractor:
         """
         # CLAHE - contrast enhancement
         if use_clahe:
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            gray = clahe.apply(gray)
+            gray = self._clahe.apply(gray)
         
         # Scale up
         if scale_factor > 1:
@@ -149,8 +206,7 @@ class AdvancedNumberExtractor:
         )
         
         # Morphological operations - clean up noise
-        kernel = np.ones((2, 2), np.uint8)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, self._close_kernel)
         
         return binary
     
@@ -181,17 +237,46 @@ class AdvancedNumberExtractor:
         
         return numbers
     
+    def ocr_batch(self, images: List[np.ndarray], config: str) -> List[str]:
+        """
+        OCR several images with a single Tesseract run.
+        
+        Images are written as pages of one multi-page TIFF, so Tesseract
+        starts and loads its model once instead of once per image.
+        
+        Returns:
+            Text per image (same order)
+        """
+        pages = [Image.fromarray(img) for img in images]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tiff_path = str(Path(tmp_dir) / "batch.tif")
+            pages[0].save(tiff_path, save_all=True, append_images=pages[1:])
+            text = pytesseract.image_to_string(tiff_path, config=config)
+        
+        # Pages are separated by form feed
+        texts = text.split('\f')
+        return (texts + [''] * len(images))[:len(images)]
+    
     def extract_multi_method(
         self,
-        image_path: str,
-        debug: bool = None
+        image_path: Union[str, np.ndarray],
+        debug: bool = None,
+        crop: bool = True,
+        stop_when: Optional[Callable[[List[float]], bool]] = None
     ) -> Dict[str, List[float]]:
         """
         Try multiple preprocessing methods and return all results.
         
         Args:
-            image_path: Path to image
+            image_path: Path to image, or an already decoded BGR image
             debug: Override debug setting (uses self.debug if None)
+            crop: Process only the detected numbers area (upscaling and
+                  OCR cost scale with pixel count)
+            stop_when: Checked on each method's numbers after every config
+                       (in config order). The first method that satisfies it
+                       is returned alone and the remaining configs are not
+                       waited for. Early results are not cached.
         
         Returns:
             Dict with results from each method
@@ -199,45 +284,115 @@ class AdvancedNumberExtractor:
         if debug is None:
             debug = self.debug
         
-        print(f"📷 Loading: {image_path}")
+        if isinstance(image_path, np.ndarray):
+            # Decoded by the caller - hash the pixels, debug images go to ./debug
+            image = image_path
+            data = np.ascontiguousarray(image)
+            layout = (image.shape, image.dtype.str)  # same bytes, different image
+            image_dir, image_stem = Path.cwd(), "image"
+            print(f"📷 Image: {image.shape[1]}x{image.shape[0]}")
+        else:
+            print(f"📷 Loading: {image_path}")
+            
+            # Read once - same bytes are hashed for the cache and decoded
+            try:
+                data = Path(image_path).read_bytes()
+            except OSError:
+                data = b''
+            image = None
+            layout = None
+            image_dir, image_stem = Path(image_path).parent, Path(image_path).stem
+        
+        cache_key = (
+            hashlib.blake2b(data, digest_size=16).hexdigest(), layout,
+            tuple(self.tesseract_configs), crop
+        )
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            print("   ♻️  Same image already processed - using cached results")
+            return dict(cached)
         
-        image = cv2.imread(image_path)
+        if image is None and len(data):
+            image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
         if image is None:
             print(f"❌ Could not load: {image_path}")
             return {}
         
+        if crop:
+            bbox = self.detect_numbers_bbox(image)
+            if bbox:
+                x, y, w, h = bbox
+                print(f"   ✂️  Numbers area: {w}x{h} of {image.shape[1]}x{image.shape[0]}")
+                image = image[y:y + h, x:x + w]
+        
         methods = ['lightness', 'channels', 'value', 'saturation']
         results = {}
         
+        # Preprocess all methods first - OCR then runs on all of them at once
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)  # shared by lightness/value/saturation
+        enhanced_images = []
         for method in methods:
-            print(f"\n🔍 Trying method: {method}")
-            
             # Preprocess
-            gray = self.preprocess_colored_text(image, method)
+            gray = self.preprocess_colored_text(image, method, hsv)
             enhanced = self.enhance_text(gray, scale_factor=3, use_clahe=True)
+            enhanced_images.append(enhanced)
             
             # Debug - save to SAME folder as image
             if debug:
                 # Save debug images NEXT TO the original image
-                image_dir = Path(image_path).parent
                 debug_dir = image_dir / "debug"
                 debug_dir.mkdir(exist_ok=True)
                 
-                debug_path_gray = debug_dir / f"{Path(image_path).stem}_step1_gray_{method}.png"
-                debug_path_enhanced = debug_dir / f"{Path(image_path).stem}_step2_enhanced_{method}.png"
+                debug_path_gray = debug_dir / f"{image_stem}_step1_gray_{method}.png"
+                debug_path_enhanced = debug_dir / f"{image_stem}_step2_enhanced_{method}.png"
                 
-                cv2.imwrite(str(debug_path_gray), gray)
-                cv2.imwrite(str(debug_path_enhanced), enhanced)
+                _DEBUG_POOL.submit(cv2.imwrite, str(debug_path_gray), gray, DEBUG_PNG_PARAMS)
+                _DEBUG_POOL.submit(cv2.imwrite, str(debug_path_enhanced), enhanced, DEBUG_PNG_PARAMS)
                 
                 if method == 'lightness':  # Print once
                     print(f"\n   💾 Debug images: {debug_dir}")
-            
-            # Try multiple OCR configs
-            all_numbers = []
-            for config in self.tesseract_configs:
-                text = pytesseract.image_to_string(enhanced, config=config)
-                numbers = self.parse_numbers(text)
-                all_numbers.extend(numbers)
+        
+        # Methods can converge (e.g. grey text: value == lightness) - OCR each distinct page once
+        page_index = {}
+        method_pages = []
+        unique_images = []
+        for enhanced in enhanced_images:
+            key = (enhanced.shape, hashlib.blake2b(np.ascontiguousarray(enhanced), digest_size=16).digest())
+            if key not in page_index:
+                page_index[key] = len(unique_images)
+                unique_images.append(enhanced)
+            method_pages.append(page_index[key])
+        
+        # Try multiple OCR configs - one Tesseract run per config covers every method.
+        # Runs are separate processes, so the configs execute concurrently.
+        pool = ThreadPoolExecutor(max_workers=len(self.tesseract_configs))
+        futures = [
+            pool.submit(self.ocr_batch, unique_images, config)
+            for config in self.tesseract_configs
+        ]
+        
+        method_numbers = {method: [] for method in methods}
+        try:
+            for future in futures:  # config order preserved
+                texts = future.result()
+                for method, page in zip(methods, method_pages):
+                    method_numbers[method].extend(self.parse_numbers(texts[page]))
+                
+                if stop_when is not None:
+                    for method in methods:
+                        numbers = list(dict.fromkeys(method_numbers[method]))
+                        if stop_when(numbers):
+                            print(f"\n⚡ Method {method}: stop condition met ({len(numbers)} numbers)")
+                            return {method: numbers}
+        finally:
+            # Only an early return leaves work pending - don't wait for it
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=False)
+        
+        for method in methods:
+            print(f"\n🔍 Method: {method}")
+            all_numbers = method_numbers[method]
             
             # Remove duplicates but keep order
             seen = set()
@@ -260,26 +415,32 @@ class AdvancedNumberExtractor:
             else:
                 print(f"      (none)")
         
-        return results
-        
-        return results
+        self._results_cache[cache_key] = results
+        return dict(results)
     
     def extract_best(
         self,
-        image_path: str,
-        debug: bool = False
+        image_path: Union[str, np.ndarray],
+        debug: bool = False,
+        expected_count: Optional[int] = None
     ) -> List[float]:
         """
         Extract using best method (most numbers found).
         
         Args:
-            image_path: Path to image
+            image_path: Path to image or decoded BGR image
             debug: Save debug images
+            expected_count: Stop as soon as a method finds exactly this many
+                            numbers (remaining OCR configs are skipped)
         
         Returns:
             List of numbers from best method
         """
-        results = self.extract_multi_method(image_path, debug)
+        stop_when = None
+        if expected_count is not None:
+            stop_when = lambda nums: len(nums) == expected_count
+        
+        results = self.extract_multi_method(image_path, debug, stop_when=stop_when)
         
         if not results:
             return []
@@ -294,14 +455,14 @@ class AdvancedNumberExtractor:
     
     def extract_combined(
         self,
-        image_path: str,
+        image_path: Union[str, np.ndarray],
         debug: bool = False
     ) -> List[float]:
         """
         Extract using all methods and combine results.
         
         Args:
-            image_path: Path to image
+            image_path: Path to image or decoded BGR image
             debug: Save debug images
         
         Returns:
@@ -325,10 +486,17 @@ class AdvancedNumberExtractor:
         return unique_numbers
 
 
+@lru_cache(maxsize=1)
+def get_extractor() -> AdvancedNumberExtractor:
+    """Shared extractor - its results cache persists across quick_extract() calls."""
+    return AdvancedNumberExtractor()
+
+
 def quick_extract(
     image_path: str,
     method: str = 'best',  # 'best', 'combined', or specific method
-    debug: bool = False
+    debug: bool = False,
+    expected_count: Optional[int] = None
 ) -> List[float]:
     """
     Quick extraction function.
@@ -338,14 +506,15 @@ def quick_extract(
         method: 'best' (most numbers), 'combined' (all methods), or 
                 'lightness', 'channels', 'value', 'saturation'
         debug: Save debug images
+        expected_count: 'best' only - stop early once a method finds this many
     
     Returns:
         List of extracted numbers
     """
-    extractor = AdvancedNumberExtractor()
+    extractor = get_extractor()
     
     if method == 'best':
-        return extractor.extract_best(image_path, debug)
+        return extractor.extract_best(image_path, debug, expected_count)
     elif method == 'combined':
         return extractor.extract_combined(image_path, debug)
     else:
@@ -363,6 +532,7 @@ def main():
         print("\nOptions:")
         print("  --method <name>   Method: best, combined, lightness, channels, value, saturation")
         print("  --debug           Save debug images to debug/ folder")
+        print("  --expected <n>    Stop early once a method finds n numbers (method 'best')")
         print("\nExamples:")
         print("  python number_extractor_advanced.py screenshot.png")
         print("  python number_extractor_advanced.py screenshot.png --method combined --debug")
@@ -379,13 +549,19 @@ def main():
     
     debug = '--debug' in sys.argv
     
+    expected_count = None
+    if '--expected' in sys.argv:
+        idx = sys.argv.index('--expected')
+        if idx + 1 < len(sys.argv):
+            expected_count = int(sys.argv[idx + 1])
+    
     # Extract
     print("\n" + "="*70)
     print(f"ADVANCED NUMBER EXTRACTION")
     print(f"Method: {method}")
     print("="*70 + "\n")
     
-    numbers = quick_extract(image_path, method, debug)
+    numbers = quick_extract(image_path, method, debug, expected_count)
     
     # Display
     print("\n" + "="*70)
@@ -0,0 +1,127 @@
+# utils/paddleocr_extractor.py
+# VERSION: 1.0
+# Third OCR backend for the comparison scripts
+# CHANGES: PaddleOCR with high-performance inference (auto OpenVINO/TensorRT/ONNX Runtime)
+
+import re
+from functools import lru_cache
+from typing import List, Tuple, Union
+import cv2
+import numpy as np
+
+try:
+    from paddleocr import PaddleOCR
+    PADDLEOCR_AVAILABLE = True
+except ImportError:
+    PADDLEOCR_AVAILABLE = False
+
+
+# "24.10x", "24.10", "24x", "24" - first match per text line
+NUMBER_PATTERN = re.compile(r'\d+\.\d+|\d+')
+
+
+class PaddleOCRExtractor:
+    """
+    Number extractor using PaddleOCR.
+
+    enable_hpi lets PaddleOCR pick the fastest installed inference engine
+    (OpenVINO / TensorRT / ONNX Runtime, FP16 where supported).
+    Install the engines with: paddleocr install_hpi_deps cpu
+    Without them PaddleOCR falls back to plain Paddle inference.
+    """
+
+    def __init__(self, high_performance: bool = True):
+        """
+        Initialize PaddleOCR.
+
+        Args:
+            high_performance: Enable high-performance inference (enable_hpi)
+        """
+        if not PADDLEOCR_AVAILABLE:
+            raise ImportError("PaddleOCR not installed! Run: pip install paddleocr paddlepaddle")
+
+        print("🔧 Initializing PaddleOCR (first time downloads models)...")
+        # Single-line numbers - angle classifier is not needed
+        self.reader = PaddleOCR(use_angle_cls=False, lang='en', enable_hpi=high_performance)
+        print("✅ PaddleOCR ready!")
+
+        self.high_performance = high_performance
+
+    def _recognize(self, image: np.ndarray) -> List[Tuple[str, float]]:
+        """Run OCR, return (text, confidence) per detected line (PaddleOCR 2.x and 3.x)"""
+        if hasattr(self.reader, 'predict'):
+            # 3.x: one result dict per input image
+            return [
+                (text, score)
+                for res in self.reader.predict(image)
+                for text, score in zip(res['rec_texts'], res['rec_scores'])
+            ]
+
+        # 2.x: [[ [bbox, (text, confidence)], ... ]]
+        result = self.reader.ocr(image, cls=False)
+        if not result or not result[0]:
+            return []
+        return [(line[1][0], line[1][1]) for line in result[0]]
+
+    def parse_numbers(self, ocr_results: List[Tuple[str, float]]) -> List[float]:
+        """
+        Parse numbers from PaddleOCR results.
+
+        Args:
+            ocr_results: List of (text, confidence) tuples
+
+        Returns:
+            List of extracted numbers
+        """
+        numbers = []
+
+        for text, confidence in ocr_results:
+            # Only use high-confidence results
+            if confidence < 0.3:
+                continue
+
+            match = NUMBER_PATTERN.search(text)
+            if match:
+                num = float(match.group())
+
+                # Sanity check
+                if 0.5 <= num <= 10000:
+                    numbers.append(num)
+
+        return numbers
+
+    def extract(self, image_path: Union[str, np.ndarray]) -> List[float]:
+        """
+        Extract numbers from image using PaddleOCR.
+
+        Args:
+            image_path: Path to image, or an already decoded BGR image
+
+        Returns:
+            List of extracted numbers
+        """
+        if isinstance(image_path, np.ndarray):
+            image = image_path
+        else:
+            print(f"📷 Loading: {image_path}")
+
+            image = cv2.imread(image_path)
+            if image is None:
+                print(f"❌ Could not load: {image_path}")
+                return []
+
+        print("🔍 Running PaddleOCR...")
+        numbers = self.parse_numbers(self._recognize(image))
+
+        # Remove duplicates but keep order
+        unique_numbers = list(dict.fromkeys(numbers))
+
+        print(f"✅ Extracted {len(unique_numbers)} numbers")
+
+        return unique_numbers
+
+
+@lru_cache(maxsize=2)
+def get_extractor(high_performance: bool = True) -> PaddleOCRExtractor:
+    """Shared extractor - the models load only once per process."""
+    return PaddleOCRExtractor(high_performance=high_performance)